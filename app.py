@@ -13,7 +13,7 @@ from PySide6.QtWidgets import QApplication, QStackedWidget, QMessageBox
 from PySide6.QtCore import Qt, Slot
 from utils.logger import setup_logger
 from utils.error_manager import error_manager, ErrorCategory, ErrorSeverity
-from utils.config import DEFAULT_TCP_PORT, DEFAULT_UDP_PORT
+from utils.config import DEFAULT_TCP_PORT, DEFAULT_UDP_PORT, get_local_ip_address
 from gui.login import LoginWindow
 from gui.hostjoin import HostJoinWindow
 from gui.mainapp import MainAppWindow
@@ -23,6 +23,9 @@ from client.media_capture import MediaCaptureManager
 
 logger = setup_logger(__name__)
 
+# Upper bound on waiting for a hosted server to bind its sockets (seconds)
+SERVER_START_TIMEOUT = 5.0
+
 class LANCommunicatorApp(QStackedWidget):
     """
     Main application controller.
@@ -57,21 +60,6 @@ class LANCommunicatorApp(QStackedWidget):
         
         logger.info("LANCommunicatorApp initialized")
     
-    def get_local_ip_address(self):
-        """Get the local IP address of this machine for LAN communication."""
-        try:
-            # Connect to a remote address to determine local IP
-            # This doesn't actually send data, just determines routing
-            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-                s.connect(("8.8.8.8", 80))
-                local_ip = s.getsockname()[0]
-                logger.info(f"Detected local IP address: {local_ip}")
-                return local_ip
-        except Exception as e:
-            logger.warning(f"Failed to detect local IP: {e}, falling back to localhost")
-            # Fallback to localhost if unable to determine IP
-            return "127.0.0.1"
-    
     @Slot(str)
     def on_login_successful(self, username: str):
         """Handle successful login."""
@@ -94,7 +82,7 @@ class LANCommunicatorApp(QStackedWidget):
         logger.info(f"Hosting session '{session_id}' as '{username}'")
         self.session_id = session_id
         self.is_host = True
-        self.server_address = self.get_local_ip_address()
+        self.server_address = get_local_ip_address()
         
         try:
             # Start server
@@ -102,9 +90,8 @@ class LANCommunicatorApp(QStackedWidget):
             server_thread = threading.Thread(target=self.server.start, daemon=True)
             server_thread.start()
             
-            # Wait for server to start and get actual ports
-            import time
-            time.sleep(1.0)  # Give server more time to start
+            # Wait until the server has bound its ports (or failed to)
+            self.server.ready_event.wait(timeout=SERVER_START_TIMEOUT)
             
             # Check if server started successfully
             if not self.server.running:
@@ -160,13 +147,10 @@ class LANCommunicatorApp(QStackedWidget):
     def _test_server_connectivity(self, server_address: str, port: int, timeout: float = 5.0) -> bool:
         """Test if server is reachable on the specified port."""
         try:
-            test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            test_socket.settimeout(timeout)
-            result = test_socket.connect_ex((server_address, port))
-            test_socket.close()
-            return result == 0
-        except Exception as e:
-            logger.debug(f"Connectivity test failed: {e}")
+            with socket.create_connection((server_address, port), timeout=timeout):
+                return True
+        except OSError as e:
+            logger.debug("Connectivity test failed: %s", e)
             return False
 
     @Slot(str, str, str)
@@ -435,38 +419,21 @@ class LANCommunicatorApp(QStackedWidget):
     @Slot(str, bytes)
     def on_audio_data_received(self, username: str, audio_data: bytes):
         """Handle received audio data and detect speaking."""
-        logger.info(f"🎵 APP: on_audio_data_received called for {username}, {len(audio_data)} bytes")
+        logger.debug("🎵 APP: on_audio_data_received called for %s, %d bytes", username, len(audio_data))
         if self.media_capture:
             self.media_capture.process_received_audio(username, audio_data)
         
-        # Pass audio data to GUI for handling
+        # Pass audio data to GUI, which detects speaking from the packet's level
         if self.main_window:
-            self.main_window.handle_audio_data_received(username, audio_data)
-        
-        # Detect if user is speaking based on audio data
-        if self.main_window and audio_data:
             try:
-                import numpy as np
-                # Convert audio data to numpy array for analysis
-                audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                
-                # Calculate RMS to detect speaking
-                rms = np.sqrt(np.mean(audio_array.astype(np.float32) ** 2))
-                normalized_rms = rms / 32767.0  # Normalize for 16-bit audio
-                
-                # Simple threshold for speaking detection
-                is_speaking = normalized_rms > 0.01  # Adjust threshold as needed
-                
-                # Update user speaking state in GUI
-                self.main_window.update_user_speaking_state(username, is_speaking)
-                
+                self.main_window.handle_audio_data_received(username, audio_data)
             except Exception as e:
                 logger.error(f"Error detecting speaking for {username}: {e}")
     
     @Slot(str, bytes)
     def on_video_data_received(self, username: str, video_data: bytes):
         """Handle received video data."""
-        logger.info(f"🎬 APP: on_video_data_received called for {username}, {len(video_data)} bytes")
+        logger.debug("🎬 APP: on_video_data_received called for %s, %d bytes", username, len(video_data))
         if self.main_window:
             self.main_window.update_video_frame(username, video_data)
     
@@ -824,13 +791,13 @@ class LANCommunicatorApp(QStackedWidget):
                 if screen_data and self.main_window:
                     # Show own screen share in presentation box
                     self.main_window.update_screen_frame(self.current_username, screen_data, 0, 0)
-                    logger.debug(f"Updated local screen frame: {len(screen_data)} bytes")
+                    logger.debug("Updated local screen frame: %d bytes", len(screen_data))
             except Exception as e:
                 logger.error(f"Error updating local screen frame: {e}")
     
     def update_self_video_frame(self, frame_data: bytes):
         """Update self video frame in GUI."""
-        logger.debug(f"update_self_video_frame called, frame size: {len(frame_data)}, username: {self.current_username}")
+        logger.debug("update_self_video_frame called, frame size: %d, username: %s", len(frame_data), self.current_username)
         if self.main_window:
             self.main_window.update_user_video_frame(self.current_username, frame_data)
         else:
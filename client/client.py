@@ -124,6 +124,9 @@ class LANClient(QObject):
             # Create TCP socket
             self.tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.tcp_socket.connect((self.server_address, self.tcp_port))
+            # Control messages are small; send them immediately rather than Nagle-batching
+            self.tcp_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             logger.info(f"Connected to TCP server at {self.server_address}:{self.tcp_port}")
             
             # Create UDP socket
@@ -261,7 +264,7 @@ class LANClient(QObject):
     def _handle_control_message(self, message: dict):
         """Handle incoming control message."""
         msg_type = message.get('type')
-        logger.debug(f"Received message type: {msg_type}")
+        logger.debug("Received message type: %s", msg_type)
         
         # Authentication response
         if msg_type == MessageType.AUTH_RESPONSE.value:
@@ -400,7 +403,7 @@ class LANClient(QObject):
         try:
             serialized = serialize_message(message)
             self.tcp_socket.sendall(serialized)
-            logger.debug(f"Sent TCP message: {message.get('type')}")
+            logger.debug("Sent TCP message: %s", message.get('type'))
         except Exception as e:
             logger.error(f"Failed to send TCP message: {e}")
             raise
@@ -534,10 +537,10 @@ class LANClient(QObject):
             
             if sender_username:
                 if stream_type == 0x01:  # Audio stream
-                    logger.info(f"Received audio packet from {sender_username}: seq={packet.seq_num}, size={len(packet.payload)}")
+                    logger.debug("Received audio packet from %s: seq=%d, size=%d", sender_username, packet.seq_num, len(packet.payload))
                     self.audio_data_received.emit(sender_username, packet.payload)
                 elif stream_type == 0x02:  # Video stream
-                    logger.info(f"Received video packet from {sender_username}: seq={packet.seq_num}, size={len(packet.payload)}")
+                    logger.debug("Received video packet from %s: seq=%d, size=%d", sender_username, packet.seq_num, len(packet.payload))
                     self.video_data_received.emit(sender_username, packet.payload)
                 else:
                     logger.warning(f"Unknown stream type: {stream_type}")
@@ -606,7 +609,7 @@ class LANClient(QObject):
             
             packed_data = packet.pack()
             self.udp_socket.sendto(packed_data, (self.server_address, self.udp_port))
-            logger.info(f"Sent audio packet: seq={packet.seq_num}, size={len(audio_data)}")
+            logger.debug("Sent audio packet: seq=%d, size=%d", packet.seq_num, len(audio_data))
             
             # Reset media error count on successful send
             if hasattr(self, 'audio_error_count'):
@@ -661,7 +664,7 @@ class LANClient(QObject):
             
             packed_data = packet.pack()
             self.udp_socket.sendto(packed_data, (self.server_address, self.udp_port))
-            logger.debug(f"Sent video packet: seq={packet.seq_num}, size={len(video_data)}")
+            logger.debug("Sent video packet: seq=%d, size=%d", packet.seq_num, len(video_data))
             
             # Reset media error count on successful send
             if hasattr(self, 'video_error_count'):
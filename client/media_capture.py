@@ -970,8 +970,15 @@ class ScreenCapture:
             with self.mss.mss() as sct:
                 monitor = sct.monitors[1]  # Primary monitor
                 
+                # Recent capture+encode+send durations; the wait after each frame is the
+                # capture interval minus their mean, so frames go out every capture_interval
+                # instead of every capture_interval + processing time
+                frame_costs = deque(maxlen=30)
+                
                 while self.is_sharing:
                     try:
+                        frame_start = time.monotonic()
+                        
                         # Capture screen
                         screenshot = sct.grab(monitor)
                         
@@ -991,8 +998,9 @@ class ScreenCapture:
                             self.client._send_tcp_message(screen_frame_msg)
                             logger.debug(f"Sent screen frame: {len(jpeg_data)} bytes")
                         
-                        # Wait for next capture
-                        time.sleep(self.capture_interval)
+                        # Wait for next capture, discounting the average time frames take to produce
+                        frame_costs.append(time.monotonic() - frame_start)
+                        time.sleep(max(0.0, self.capture_interval - sum(frame_costs) / len(frame_costs)))
                         
                     except Exception as e:
                         logger.error(f"Screen capture frame error: {e}")
@@ -4,7 +4,6 @@ Provides UI for hosting a new session or joining an existing one.
 """
 
 import secrets
-import socket
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QStackedWidget, QMessageBox
@@ -12,7 +11,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Signal, Qt
 from PySide6.QtGui import QFont
 from utils.logger import setup_logger
-from utils.config import config, DEFAULT_TCP_PORT, DEFAULT_UDP_PORT
+from utils.config import config, DEFAULT_TCP_PORT, DEFAULT_UDP_PORT, get_local_ip_address
 
 logger = setup_logger(__name__)
 
@@ -32,7 +31,7 @@ class HostJoinWindow(QWidget):
         super().__init__()
         self.username = username
         self.session_id = None
-        self.server_ip = self.get_local_ip_address()
+        self.server_ip = get_local_ip_address()
         self.setWindowTitle("LAN Communicator - Session")
         self.resize(500, 400)
         self.setup_ui()
@@ -366,19 +365,6 @@ class HostJoinWindow(QWidget):
         
         return page
     
-    def get_local_ip_address(self):
-        """Get the local IP address of this machine."""
-        try:
-            # Connect to a remote address to determine local IP
-            # This doesn't actually send data, just determines routing
-            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-                s.connect(("8.8.8.8", 80))
-                local_ip = s.getsockname()[0]
-                return local_ip
-        except Exception:
-            # Fallback to localhost if unable to determine IP
-            return "127.0.0.1"
-    
     def generate_session_id(self):
         """Generate a random session ID."""
         # Generate 8-character alphanumeric session ID
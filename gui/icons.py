@@ -6,7 +6,7 @@ Contains all media control icons with ON/OFF states.
 from PySide6.QtGui import QIcon, QPixmap, QPainter
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtCore import QByteArray, QSize, Qt
-from PySide6.QtWidgets import QPushButton
+from PySide6.QtWidgets import QPushButton, QWidget
 
 # SVG icon definitions
 MICROPHONE_SVG = """
@@ -70,6 +70,10 @@ CHAT_SVG = """
 </svg>
 """
 
+# Rendered icons keyed by (svg_content, width, height, color, slashed).
+# Rasterizing SVG is slow and only a handful of icon variants are ever used.
+_icon_cache = {}
+
 def create_svg_icon(svg_content: str, size: QSize = QSize(24, 24), color: str = "white") -> QIcon:
     """
     Create a QIcon from SVG content with specified color.
@@ -82,6 +86,11 @@ def create_svg_icon(svg_content: str, size: QSize = QSize(24, 24), color: str =
     Returns:
         QIcon object
     """
+    key = (svg_content, size.width(), size.height(), color, False)
+    icon = _icon_cache.get(key)
+    if icon is not None:
+        return icon
+    
     # Replace currentColor with the specified color
     colored_svg = svg_content.replace("currentColor", color)
     
@@ -98,7 +107,8 @@ def create_svg_icon(svg_content: str, size: QSize = QSize(24, 24), color: str =
     renderer.render(painter)
     painter.end()
     
-    return QIcon(pixmap)
+    icon = _icon_cache[key] = QIcon(pixmap)
+    return icon
 
 def create_icon_with_slash(svg_content: str, size: QSize = QSize(24, 24), color: str = "white") -> QIcon:
     """
@@ -112,6 +122,11 @@ def create_icon_with_slash(svg_content: str, size: QSize = QSize(24, 24), color:
     Returns:
         QIcon object with slash overlay
     """
+    key = (svg_content, size.width(), size.height(), color, True)
+    icon = _icon_cache.get(key)
+    if icon is not None:
+        return icon
+    
     # Replace currentColor with the specified color
     colored_svg = svg_content.replace("currentColor", color)
     
@@ -134,12 +149,29 @@ def create_icon_with_slash(svg_content: str, size: QSize = QSize(24, 24), color:
     renderer.render(painter)
     painter.end()
     
-    return QIcon(pixmap)
+    icon = _icon_cache[key] = QIcon(pixmap)
+    return icon
+
+def set_style_state(widget: QWidget, name: str, value):
+    """
+    Set a dynamic property used by stylesheet selectors (e.g. [active="true"]).
+    
+    Only re-polishes the widget when the value actually changes, so state
+    toggles never re-parse a stylesheet.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
 
 def set_button_icon(button: QPushButton, svg_content: str, is_active: bool, size: QSize = QSize(24, 24)):
     """
     Set button icon based on active state.
     
+    The button's colors come from the window stylesheet, which selects on
+    the "active" property (grey when active, red when inactive).
+    
     Args:
         button: QPushButton to update
         svg_content: SVG content for the icon
@@ -147,38 +179,11 @@ def set_button_icon(button: QPushButton, svg_content: str, is_active: bool, size
         size: Icon size
     """
     if is_active:
-        # Active state - white icon on grey background
+        # Active state - white icon
         icon = create_svg_icon(svg_content, size, "white")
-        button.setIcon(icon)
-        button.setText("")
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: #3c4043;
-                border: none;
-                border-radius: 25px;
-            }
-            QPushButton:hover {
-                background-color: #5f6368;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """)
     else:
-        # Inactive state - white icon with slash on red background
+        # Inactive state - white icon with slash
         icon = create_icon_with_slash(svg_content, size, "white")
-        button.setIcon(icon)
-        button.setText("")
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                border: none;
-                border-radius: 25px;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-            QPushButton:pressed {
-                background-color: #bd2130;
-            }
-        """)
\ No newline at end of file
+    button.setIcon(icon)
+    button.setText("")
+    set_style_state(button, "active", is_active)
\ No newline at end of file
@@ -5,27 +5,375 @@ Main communication interface with chat, files, video, and user management.
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTextEdit, QLineEdit, QListWidget, QListWidgetItem,
+    QPushButton, QTextEdit, QLineEdit, QListView,
     QTabWidget, QSplitter, QProgressBar, QFileDialog, QMessageBox,
     QCheckBox, QRadioButton, QButtonGroup, QGroupBox, QGridLayout,
     QStatusBar, QScrollArea, QFrame
 )
-from PySide6.QtCore import Signal, Qt, Slot, QSize, QTimer
-from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtCore import (
+    Signal, Qt, Slot, QSize, QTimer, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex
+)
+from PySide6.QtGui import (
+    QPixmap, QImage, QTextCursor, QTextCharFormat, QTextBlockFormat, QTextFormat, QColor, QFont, QGuiApplication, QPainter
+)
 from utils.logger import setup_logger
+from utils.config import MAX_CHAT_MESSAGES
 from utils.error_manager import error_manager, ErrorCategory, ErrorSeverity
-from gui.status_widgets import EnhancedStatusBar, NotificationWidget
+from gui.status_widgets import EnhancedStatusBar
 from gui.icons import (
     MICROPHONE_SVG, MICROPHONE_OFF_SVG, VIDEO_SVG, VIDEO_OFF_SVG,
     SCREEN_SHARE_SVG, SCREEN_SHARE_OFF_SVG, PHONE_HANGUP_SVG,
-    USERS_SVG, CHAT_SVG, set_button_icon
+    USERS_SVG, CHAT_SVG, set_button_icon, set_style_state, create_svg_icon
 )
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice
 import os
 import hashlib
+import struct
+import threading
+import numpy as np
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # Module missing, or the libturbojpeg shared library could not be loaded
+    turbo_jpeg = None
+
+# JPEG decoder used for video and screen frames (see decode_jpeg_frame)
+JPEG_DECODER = "libjpeg-turbo" if turbo_jpeg is not None else "OpenCV" if cv2 is not None else "Qt image plugin"
 
 logger = setup_logger(__name__)
 
+# Window-level stylesheet for MainAppWindow. Widgets opt in through their
+# objectName so the sheet is parsed once and never leaks into dialogs.
+MAINAPP_QSS = """
+QWidget#MediaView {
+    background-color: #202124;
+    color: white;
+}
+QWidget#ContentArea {
+    background-color: #202124;
+    border: none;
+}
+UserBox {
+    background: transparent;
+    border: none;
+}
+QLabel#WelcomeLabel {
+    font-size: 18px;
+    color: #666;
+    padding: 40px;
+    background-color: #f8f9fa;
+    border: 2px dashed #ddd;
+    border-radius: 15px;
+}
+QWidget#ControlsBar {
+    background-color: #1a1a1a;
+    border-top: 1px solid #333;
+}
+QPushButton#SessionBtn {
+    background-color: #3c4043;
+    border: none;
+    border-radius: 6px;
+    font-size: 12px;
+    color: white;
+    padding: 8px 12px;
+    text-align: left;
+}
+QPushButton#SessionBtn:hover {
+    background-color: #5f6368;
+}
+QPushButton#SessionBtn:pressed {
+    background-color: #2d2d2d;
+}
+QPushButton#EndSessionBtn {
+    background-color: #ea4335;
+    border: none;
+    border-radius: 25px;
+}
+QPushButton#EndSessionBtn:hover {
+    background-color: #d33b2c;
+}
+QPushButton#EndSessionBtn:pressed {
+    background-color: #b52d20;
+}
+QPushButton#RoundIconBtn {
+    background-color: #3c4043;
+    border: none;
+    border-radius: 25px;
+}
+QPushButton#RoundIconBtn:hover {
+    background-color: #5f6368;
+}
+QPushButton#RoundIconBtn:pressed {
+    background-color: #2d2d2d;
+}
+QPushButton#RoundIconBtn[active="true"] {
+    background-color: #007bff;
+}
+QPushButton#RoundIconBtn[active="true"]:hover {
+    background-color: #0056b3;
+}
+QPushButton#RoundIconBtn[active="true"]:pressed {
+    background-color: #004085;
+}
+QPushButton#MediaToggleBtn {
+    background-color: #dc3545;
+    border: none;
+    border-radius: 25px;
+}
+QPushButton#MediaToggleBtn:hover {
+    background-color: #c82333;
+}
+QPushButton#MediaToggleBtn:pressed {
+    background-color: #bd2130;
+}
+QPushButton#MediaToggleBtn[active="true"] {
+    background-color: #3c4043;
+}
+QPushButton#MediaToggleBtn[active="true"]:hover {
+    background-color: #5f6368;
+}
+QPushButton#MediaToggleBtn[active="true"]:pressed {
+    background-color: #2d2d2d;
+}
+QPushButton#MediaToggleBtn[error="true"],
+QPushButton#MediaToggleBtn[error="true"]:hover,
+QPushButton#MediaToggleBtn[error="true"]:pressed {
+    background-color: #ffcdd2;
+    border: 2px solid #d32f2f;
+}
+QWidget#SessionPopup {
+    background-color: #fff;
+    border: 2px solid #ddd;
+    border-radius: 8px;
+}
+QLabel#SessionPopupTitle, QLabel#SessionPopupDetail {
+    background-color: #fff;
+    border: 2px solid #ddd;
+    border-radius: 8px;
+    color: #666;
+}
+QLabel#SessionPopupTitle {
+    font-weight: bold;
+    color: #333;
+}
+QPushButton#CopySessionBtn {
+    background-color: #007bff;
+    color: white;
+    border: none;
+    border-radius: 4px;
+    padding: 8px;
+    font-weight: bold;
+    margin-top: 10px;
+}
+QPushButton#CopySessionBtn:hover {
+    background-color: #0056b3;
+}
+QWidget#Sidebar {
+    background-color: #4a4a4a;
+    border-left: 1px solid #333;
+    color: white;
+}
+QWidget#SidebarHeader {
+    background-color: #3a3a3a;
+    border-left: 1px solid #333;
+    border-bottom: 1px solid #555;
+    color: white;
+}
+QPushButton#SidebarCloseBtn {
+    background-color: transparent;
+    border: none;
+    font-size: 16px;
+    font-weight: bold;
+    color: white;
+    border-radius: 15px;
+}
+QPushButton#SidebarCloseBtn:hover {
+    background-color: #555;
+    color: white;
+}
+QTabWidget#SidebarTabs, QWidget#SidebarContent {
+    background-color: #4a4a4a;
+    border-left: 1px solid #333;
+}
+QTabWidget#SidebarTabs::pane {
+    border: none;
+    background-color: #4a4a4a;
+}
+QTabBar#SidebarTabBar::tab {
+    background-color: #5a5a5a;
+    color: white;
+    padding: 8px 16px;
+    margin-right: 2px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+}
+QTabBar#SidebarTabBar::tab:selected {
+    background-color: #3a3a3a;
+    color: white;
+    border-bottom: 2px solid #007bff;
+}
+QLabel#UsersHeading {
+    font-size: 14px;
+    font-weight: bold;
+    color: #212529;
+    margin-bottom: 10px;
+}
+QListView#UsersList {
+    background-color: #2a2a2a;
+    border: 1px solid #555;
+    border-radius: 4px;
+    padding: 5px;
+}
+QListView#UsersList::item {
+    padding: 8px;
+    border-bottom: 1px solid #555;
+    border-radius: 4px;
+    margin: 2px 0;
+    color: white;
+}
+QListView#UsersList::item:hover {
+    background-color: #3a3a3a;
+}
+QListView#UsersList::item:selected {
+    background-color: #007bff;
+    color: white;
+}
+QTextEdit#ChatDisplay {
+    background-color: #2a2a2a;
+    border: 1px solid #555;
+    border-radius: 4px;
+    padding: 10px;
+    font-size: 13px;
+    color: white;
+}
+QLineEdit#ChatInput {
+    border: 1px solid #555;
+    border-radius: 4px;
+    padding: 8px;
+    font-size: 13px;
+    background-color: #2a2a2a;
+    color: white;
+}
+QPushButton#SendBtn {
+    background-color: #007bff;
+    color: white;
+    font-weight: bold;
+    border-radius: 4px;
+    border: none;
+}
+QPushButton#SendBtn:hover {
+    background-color: #0056b3;
+}
+QGroupBox#ShareFileGroup {
+    font-weight: bold;
+    border: 1px solid #555;
+    border-radius: 4px;
+    margin-top: 10px;
+    padding-top: 10px;
+    color: white;
+}
+QGroupBox#ShareFileGroup::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+    color: white;
+}
+QLabel#SelectedFileLabel {
+    color: #ccc;
+    font-size: 12px;
+}
+QPushButton#BrowseBtn {
+    background-color: #6c757d;
+    color: white;
+    border: none;
+    padding: 8px;
+    border-radius: 4px;
+}
+QPushButton#BrowseBtn:hover {
+    background-color: #545b62;
+}
+QPushButton#ShareBtn {
+    background-color: #28a745;
+    color: white;
+    font-weight: bold;
+    padding: 8px;
+    border: none;
+    border-radius: 4px;
+}
+QPushButton#ShareBtn:hover {
+    background-color: #218838;
+}
+QLabel#FilesHeading {
+    font-weight: bold;
+    margin-top: 10px;
+    color: white;
+}
+QListView#FilesList {
+    border: 1px solid #555;
+    border-radius: 4px;
+    background-color: #2a2a2a;
+    color: white;
+}
+QListView#FilesList::item {
+    padding: 8px;
+    border-bottom: 1px solid #555;
+}
+QListView#FilesList::item:hover {
+    background-color: #3a3a3a;
+}
+QPushButton#DownloadBtn {
+    background-color: #007bff;
+    color: white;
+    padding: 8px;
+    border: none;
+    border-radius: 4px;
+}
+QPushButton#DownloadBtn:hover {
+    background-color: #0056b3;
+}
+QFrame#StatusSeparator {
+    color: #ccc;
+}
+QLabel#StatusInfoLabel {
+    font-size: 10px;
+    color: #666;
+}
+"""
+
+# (rows, cols) of the video grid indexed by item count; larger counts use the last entry (4x4)
+GRID_DIMENSIONS = (
+    (1, 1),  # 0: welcome message
+    (1, 1),  # 1: single user takes full space
+    (1, 2),  # 2: side by side
+    (2, 2), (2, 2),  # 3-4
+    (2, 3), (2, 3),  # 5-6
+    (3, 3), (3, 3), (3, 3),  # 7-9
+    (3, 4), (3, 4), (3, 4),  # 10-12
+    (4, 4),  # 13+
+)
+
+# Delay before pending grid changes (joins, leaves, presentations, resizes) are applied in one rebuild
+GRID_UPDATE_DELAY_MS = 50
+
+# Normalized RMS level above which a received audio packet counts as speech
+SPEAKING_RMS_THRESHOLD = 0.01
+
 def generate_avatar_color(username: str) -> str:
     """Generate a consistent color for a username using hash - matching reference images."""
     # Colors matching the reference images for profile boxes
@@ -54,6 +402,174 @@ def generate_avatar_color(username: str) -> str:
     
     return colors[color_index]
 
+def frame_hash(frame_data: bytes) -> int:
+    """Cheap non-cryptographic hash used to spot repeated video frames."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(frame_data)
+    return hash(frame_data)
+
+def _turbo_scaling_factor(width: int, height: int, target_size: tuple):
+    """Smallest libjpeg-turbo downscaling factor that still covers target_size (None = full size)."""
+    scale = min(target_size[0] / width, target_size[1] / height)
+    best = None
+    for num, denom in turbo_jpeg.scaling_factors:
+        if scale <= num / denom < 1.0 and (best is None or num / denom < best[0] / best[1]):
+            best = (num, denom)
+    return best
+
+def jpeg_size(frame_data: bytes):
+    """Read (width, height) from a JPEG's SOF header without decoding, or None if not found."""
+    if frame_data[:2] != b'\xff\xd8':
+        return None
+    
+    pos = 2
+    while pos + 9 <= len(frame_data):
+        if frame_data[pos] != 0xFF:
+            return None
+        marker = frame_data[pos + 1]
+        if marker == 0xFF:
+            pos += 1  # Fill byte
+            continue
+        # SOF0-SOF15, except DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack('>HH', frame_data[pos + 5:pos + 9])
+            return width, height
+        pos += 2 + struct.unpack('>H', frame_data[pos + 2:pos + 4])[0]
+    return None
+
+def _cv2_reduced_flag(frame_data: bytes, target_size: tuple):
+    """Largest OpenCV reduced-decode flag (1/2, 1/4, 1/8 in the DCT domain) that still covers target_size."""
+    size = jpeg_size(frame_data)
+    if size is None or not size[0] or not size[1]:
+        return cv2.IMREAD_COLOR
+    scale = min(target_size[0] / size[0], target_size[1] / size[1])
+    for factor, flag in ((8, cv2.IMREAD_REDUCED_COLOR_8), (4, cv2.IMREAD_REDUCED_COLOR_4), (2, cv2.IMREAD_REDUCED_COLOR_2)):
+        if scale <= 1 / factor:
+            return flag
+    return cv2.IMREAD_COLOR
+
+def decode_jpeg_frame(frame_data: bytes, target_size: tuple = None):
+    """
+    Decode JPEG frame data into a QImage.
+    
+    Safe to call from worker threads (only QImage is touched, never QPixmap).
+    
+    Args:
+        frame_data: JPEG encoded frame
+        target_size: Optional (width, height) of the display tile; larger frames
+            are shrunk to fit it (aspect ratio kept) so the GUI thread doesn't have to
+    
+    Returns:
+        Decoded QImage, or None if the data could not be decoded
+    """
+    if turbo_jpeg is not None or cv2 is not None:
+        if turbo_jpeg is not None:
+            # libjpeg-turbo can do the coarse part of the shrink (1/2, 1/4, 1/8) inside the IDCT
+            try:
+                scaling_factor = None
+                if target_size:
+                    width, height = turbo_jpeg.decode_header(frame_data)[:2]
+                    scaling_factor = _turbo_scaling_factor(width, height, target_size)
+                frame = turbo_jpeg.decode(frame_data, pixel_format=TJPF_BGR, scaling_factor=scaling_factor)
+            except OSError:
+                return None
+        else:
+            # Large frames (e.g. 1080p screen shares) are shrunk while decoding, which skips most of the IDCT
+            flags = _cv2_reduced_flag(frame_data, target_size) if target_size else cv2.IMREAD_COLOR
+            # frombuffer is a zero-copy view of the JPEG bytes; imdecode returns a C-contiguous BGR array
+            frame = cv2.imdecode(np.frombuffer(frame_data, np.uint8), flags)
+            if frame is None:
+                return None
+        
+        height, width = frame.shape[:2]
+        if target_size and cv2 is not None:
+            scale = min(target_size[0] / width, target_size[1] / height)
+            if scale < 1.0:
+                width = max(1, int(width * scale))
+                height = max(1, int(height * scale))
+                frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+        
+        # Wrap the native BGR buffer directly (copy so the numpy buffer can be released)
+        image = QImage(frame.data, width, height, frame.strides[0], QImage.Format_BGR888).copy()
+    else:
+        # Fall back to Qt's own image loader
+        image = QImage.fromData(frame_data)
+        if image.isNull():
+            return None
+    
+    if target_size and (image.width() > target_size[0] or image.height() > target_size[1]):
+        image = image.scaled(target_size[0], target_size[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+class FrameDecodeSignals(QObject):
+    """
+    Signals emitted by FrameDecodeRunnable (QRunnable can't own signals).
+    
+    Decoded frames wait in a one-slot-per-user mailbox. frame_ready is only
+    emitted when the slot was empty, so if the GUI thread falls behind, newer
+    frames replace the undisplayed one instead of queueing up behind it.
+    """
+    
+    frame_ready = Signal(str)  # username whose newest decoded frame is waiting in take_frame()
+    
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._ready = {}  # username -> newest decoded QImage not yet displayed
+    
+    def post_frame(self, username: str, image: QImage):
+        """Publish a decoded frame (called from decode workers)."""
+        with self._lock:
+            queued = username in self._ready
+            self._ready[username] = image
+        if not queued:
+            self.frame_ready.emit(username)
+    
+    def take_frame(self, username: str):
+        """Pop the newest decoded frame for a user, or None if it was already taken or dropped."""
+        with self._lock:
+            return self._ready.pop(username, None)
+    
+    def discard(self, username: str = None):
+        """Drop undisplayed frames for one user, or for everyone."""
+        with self._lock:
+            if username is None:
+                self._ready.clear()
+            else:
+                self._ready.pop(username, None)
+
+class FrameDecodeRunnable(QRunnable):
+    """
+    Decodes video or screen share frames for one user on a QThreadPool worker thread.
+    
+    (frame_data, target_size) pairs are pulled through take_frame() until it
+    returns None, so a burst of frames that arrived while decoding is
+    collapsed to the newest one.
+    """
+    
+    def __init__(self, signals: FrameDecodeSignals, username: str, take_frame):
+        super().__init__()
+        self.signals = signals
+        self.username = username
+        self.take_frame = take_frame
+    
+    def run(self):
+        """Decode pending frames and hand the results back to the GUI thread."""
+        while True:
+            pending = self.take_frame(self.username)
+            if pending is None:
+                break
+            
+            frame_data, target_size = pending
+            try:
+                image = decode_jpeg_frame(frame_data, target_size)
+                if image is not None:
+                    self.signals.post_frame(self.username, image)
+                else:
+                    logger.warning(f"Failed to decode frame from {self.username}")
+            except Exception as e:
+                logger.error(f"Error decoding frame for {self.username}: {e}")
+
 class PresentationBox(QWidget):
     """Presentation box widget for screen sharing display."""
     
@@ -80,6 +596,7 @@ class PresentationBox(QWidget):
         
         # Screen display area
         self.screen_area = QLabel(self)
+        self.screen_area.setTextFormat(Qt.PlainText)
         self.screen_area.setAlignment(Qt.AlignCenter)
         self.screen_area.setScaledContents(True)
         self.screen_area.setStyleSheet("""
@@ -94,6 +611,7 @@ class PresentationBox(QWidget):
         
         # Title label
         self.title_label = QLabel(self)
+        self.title_label.setTextFormat(Qt.PlainText)  # Usernames are never parsed as HTML
         self.title_label.setText(f"{self.username}'s Presentation")
         self.title_label.setStyleSheet("""
             QLabel {
@@ -127,17 +645,11 @@ class PresentationBox(QWidget):
             return
         
         try:
-            # Convert frame data to QPixmap
-            pixmap = QPixmap()
-            if pixmap.loadFromData(frame_data):
-                # Scale pixmap to fit the screen area while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(
-                    self.screen_area.size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.screen_area.setPixmap(scaled_pixmap)
-                self.screen_area.setText("")  # Clear text when showing screen
+            # Same decoder as the worker path (libjpeg-turbo/OpenCV before Qt's image plugin)
+            area_size = self.screen_area.size()
+            image = decode_jpeg_frame(frame_data, (area_size.width(), area_size.height()) if not area_size.isEmpty() else None)
+            if image is not None:
+                self.set_screen_pixmap(QPixmap.fromImage(image))
             else:
                 self.screen_area.setText("Failed to load screen data")
                 
@@ -145,11 +657,58 @@ class PresentationBox(QWidget):
             logger.error(f"Error setting screen frame for {self.username}: {e}")
             self.screen_area.setText("Error displaying screen")
     
+    def set_screen_pixmap(self, pixmap: QPixmap):
+        """Set an already decoded screen frame for this presentation."""
+        # Scale pixmap to fit the screen area while maintaining aspect ratio
+        # (frames pre-scaled by the decode worker already fit and skip this)
+        if pixmap.size().scaled(self.screen_area.size(), Qt.KeepAspectRatio) != pixmap.size():
+            pixmap = pixmap.scaled(
+                self.screen_area.size(),
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+        self.screen_area.setPixmap(pixmap)
+        self.screen_area.setText("")  # Clear text when showing screen
+    
     def clear_screen(self):
         """Clear screen and show placeholder."""
         self.screen_area.setText("No screen being shared")
         self.screen_area.setPixmap(QPixmap())
 
+class VideoFrameWidget(QWidget):
+    """Paints the latest video frame stretched over the widget, without per-frame rescaled copies."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._frame = None  # latest frame (implicitly shared QPixmap)
+        self._smooth = False  # filter the blit; only worth it once the stream has settled
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+    
+    def set_frame(self, pixmap: QPixmap, smooth: bool = False):
+        """Show a new frame; the scaling happens in the paint itself."""
+        self._frame = pixmap
+        self._smooth = smooth
+        self.update()
+    
+    def set_smooth(self, smooth: bool):
+        """Repaint the current frame with or without smooth filtering."""
+        if smooth != self._smooth:
+            self._smooth = smooth
+            self.update()
+    
+    def clear(self):
+        """Drop the current frame."""
+        self._frame = None
+        self.update()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self._frame is None or self._frame.isNull():
+            painter.fillRect(self.rect(), Qt.black)
+            return
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, self._smooth)
+        painter.drawPixmap(self.rect(), self._frame)
+
 class UserBox(QWidget):
     """Individual user box widget for dynamic responsive grid."""
     
@@ -159,7 +718,17 @@ class UserBox(QWidget):
         self.is_self = is_self
         self.is_speaking = False
         self.has_video = False
+        self._layout_key = None  # (width, height, has_video) last laid out by update_size
         self.avatar_color = generate_avatar_color(username)
+        
+        # Live frames are painted with the cheap filter; once they stop changing the last one
+        # is repainted with smooth filtering. The delay is longer than the frame gap of slow
+        # (~7 fps) streams so they don't get a smooth pass after every frame.
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(150)
+        self._smooth_timer.timeout.connect(self._smooth_video_frame)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -177,18 +746,17 @@ class UserBox(QWidget):
             }}
         """)
         
-        # Also set the UserBox style to override any parent styles
-        self.setStyleSheet(f"""
-            UserBox {{
-                background-color: {self.avatar_color};
-                border: none;
-            }}
-        """)
+        # The box itself stays transparent (UserBox rule in MAINAPP_QSS); the frame paints the color
+        self.setAttribute(Qt.WA_StyledBackground, True)
         
         # Video area (can show video or avatar)
         self.video_area = QLabel(self)
+        self.video_area.setTextFormat(Qt.PlainText)
         self.video_area.setAlignment(Qt.AlignCenter)
-        self.video_area.setScaledContents(True)
+        
+        # Video frames are painted by their own widget on top of the avatar label
+        self.video_frame = VideoFrameWidget(self)
+        self.video_frame.hide()
         
         # Store initials for fallback
         self.initials = ''.join([name[0].upper() for name in self.username.split()[:2]])
@@ -198,6 +766,7 @@ class UserBox(QWidget):
         
         # Username label (positioned at bottom left corner like reference)
         self.name_label = QLabel(self)
+        self.name_label.setTextFormat(Qt.PlainText)  # Usernames are never parsed as HTML
         display_name = f"{self.username}" if not self.is_self else f"{self.username}"
         self.name_label.setText(display_name)
         self.name_label.setStyleSheet("""
@@ -213,7 +782,6 @@ class UserBox(QWidget):
         self.name_label.adjustSize()
         
         # Microphone mute icon (top right corner like reference)
-        from gui.icons import create_svg_icon
         self.mic_icon = QLabel(self)
         mic_off_icon = create_svg_icon(MICROPHONE_OFF_SVG, QSize(20, 20), "white")
         self.mic_icon.setPixmap(mic_off_icon.pixmap(QSize(20, 20)))
@@ -231,6 +799,10 @@ class UserBox(QWidget):
     
     def update_speaking_state(self, is_speaking: bool):
         """Update the visual state based on speaking status."""
+        # Audio packets report the same state many times a second; only restyle on a flip
+        # (the frame starts out styled as not speaking)
+        if is_speaking == self.is_speaking:
+            return
         self.is_speaking = is_speaking
         
         # Apply green border when speaking, maintain colored background
@@ -256,6 +828,10 @@ class UserBox(QWidget):
     def _set_placeholder_mode(self):
         """Set the video area to show large initial letter like reference images."""
         self.has_video = False
+        self._layout_key = None
+        self._smooth_timer.stop()
+        self.video_frame.clear()
+        self.video_frame.hide()
         
         # Get first letter of username for avatar
         initial = self.username[0].upper() if self.username else "?"
@@ -272,10 +848,15 @@ class UserBox(QWidget):
             }
         """)
         self.video_area.setText(initial)
-        self.video_area.setPixmap(QPixmap())  # Clear any existing pixmap
     
     def update_size(self, width: int, height: int):
         """Update the size and position elements matching reference images."""
+        # Grid rebuilds re-apply the same tile size; skip the restyle and repositioning if nothing changed
+        layout_key = (width, height, self.has_video)
+        if layout_key == self._layout_key:
+            return
+        self._layout_key = layout_key
+        
         self.setFixedSize(width, height)
         
         # Resize background frame to fill the entire UserBox
@@ -309,6 +890,7 @@ class UserBox(QWidget):
             else:
                 # Video mode - fill the entire box completely with rounded corners
                 self.video_area.setGeometry(0, 0, width, height)
+                self.video_frame.setGeometry(0, 0, width, height)
         
         # Position username label at bottom left corner (like reference images)
         if hasattr(self, 'name_label'):
@@ -325,6 +907,7 @@ class UserBox(QWidget):
     def _set_video_mode(self):
         """Set the video area to show video frames."""
         self.has_video = True
+        self._layout_key = None
         # Video fills the entire area with rounded corners to match the box
         self.video_area.setStyleSheet("""
             QLabel {
@@ -333,6 +916,7 @@ class UserBox(QWidget):
             }
         """)
         self.video_area.setText("")  # Clear text when showing video
+        self.video_frame.show()
     
     def set_video_frame(self, frame_data: bytes):
         """Set video frame for this user."""
@@ -342,33 +926,40 @@ class UserBox(QWidget):
             return
         
         try:
-            # Convert JPEG bytes to QPixmap
-            pixmap = QPixmap()
-            if pixmap.loadFromData(frame_data):
-                # Switch to video mode if not already
-                if not self.has_video:
-                    logger.info(f"UserBox {self.username} switching to video mode")
-                    self._set_video_mode()
-                    # Update size to ensure video area fills the box
-                    self.update_size(self.width(), self.height())
-                
-                # Scale pixmap to fit the video area while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(
-                    self.video_area.size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.video_area.setPixmap(scaled_pixmap)
-                logger.debug(f"Video frame set for {self.username}, pixmap size: {scaled_pixmap.size()}")
+            # Same decoder as the worker path (libjpeg-turbo/OpenCV before Qt's image plugin)
+            area_size = self.video_area.size()
+            image = decode_jpeg_frame(frame_data, (area_size.width(), area_size.height()) if not area_size.isEmpty() else None)
+            if image is not None:
+                self.set_video_pixmap(QPixmap.fromImage(image))
             else:
                 # Failed to load image, use placeholder
                 logger.warning(f"Failed to load video frame data for {self.username}")
                 self._set_placeholder_mode()
-                
+        
         except Exception as e:
             logger.error(f"Error setting video frame for {self.username}: {e}")
             self._set_placeholder_mode()
     
+    def set_video_pixmap(self, pixmap: QPixmap):
+        """Set an already decoded video frame for this user."""
+        # Switch to video mode if not already
+        if not self.has_video:
+            logger.info(f"UserBox {self.username} switching to video mode")
+            self._set_video_mode()
+            # Update size to ensure video area fills the box
+            self.update_size(self.width(), self.height())
+        
+        self.video_frame.set_frame(pixmap)
+        # Frames pre-scaled by the decode worker to the tile size need no filtering at all
+        if pixmap.size() != self.video_frame.size():
+            self._smooth_timer.start()  # Restarted by every frame, so it fires once the stream settles
+        logger.debug("Video frame set for %s, pixmap size: %s", self.username, pixmap.size())
+    
+    def _smooth_video_frame(self):
+        """Repaint the last video frame with smooth filtering."""
+        if self.has_video:
+            self.video_frame.set_smooth(True)
+    
     def clear_video(self):
         """Clear video and return to placeholder mode."""
         self._set_placeholder_mode()
@@ -376,7 +967,6 @@ class UserBox(QWidget):
     def update_audio_state(self, is_audio_active: bool):
         """Update microphone icon based on audio state."""
         if hasattr(self, 'mic_icon'):
-            from gui.icons import create_svg_icon
             if is_audio_active:
                 # Show microphone icon (audio active)
                 mic_icon = create_svg_icon(MICROPHONE_SVG, QSize(20, 20), "white")
@@ -386,6 +976,69 @@ class UserBox(QWidget):
             
             self.mic_icon.setPixmap(mic_icon.pixmap(QSize(20, 20)))
 
+class AvailableFilesModel(QAbstractListModel):
+    """List model for shared files; display text is formatted on demand."""
+    
+    FilenameRole = Qt.UserRole + 1  # Qt.UserRole holds the file_id
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._files = []  # list of (file_id, filename, size, uploader)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._files)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        file_id, filename, size, uploader = self._files[index.row()]
+        if role == Qt.DisplayRole:
+            size_mb = size / (1024 * 1024)
+            return f"{filename} ({size_mb:.2f} MB) - from {uploader}"
+        if role == Qt.UserRole:
+            return file_id
+        if role == self.FilenameRole:
+            return filename
+        return None
+    
+    def add_file(self, file_id: str, filename: str, size: int, uploader: str):
+        """Append a file as a single row insertion."""
+        row = len(self._files)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._files.append((file_id, filename, size, uploader))
+        self.endInsertRows()
+
+class UsersListModel(QAbstractListModel):
+    """List model for the users sidebar."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._users = []  # list of (username, is_self)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._users)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        username, is_self = self._users[index.row()]
+        if role == Qt.DisplayRole:
+            return f"👤 {username} (You)" if is_self else f"👤 {username}"
+        if role == Qt.UserRole:
+            return username
+        return None
+    
+    def set_users(self, self_username: str, usernames):
+        """Replace the user list in one model reset (self first); no-op if nothing changed."""
+        users = [(self_username, True)] + [(username, False) for username in usernames]
+        if users == self._users:
+            return
+        self.beginResetModel()
+        self._users = users
+        self.endResetModel()
+
 class MainAppWindow(QMainWindow):
     """
     Main application window with full communication features.
@@ -420,30 +1073,36 @@ class MainAppWindow(QMainWindow):
         self.server_address = server_address or "localhost"
         self.connected_users = {}  # username -> user_info dict
         self.available_files = {}  # file_id -> file_info dict
+        self.files_model = AvailableFilesModel(self)
         
         self.audio_active = False
         self.video_active = False
         self.screen_share_active = False
         
         # Audio strength monitoring
-        self.current_audio_strength = 0.0
-        self.peak_audio_strength = 0.0
+        self.media_manager = None  # set by set_media_manager once media is up
+        self.speaking_timers = {}  # username -> single-shot QTimer that clears their speaking state
         self.audio_strength_timer = QTimer()
         self.audio_strength_timer.timeout.connect(self._update_audio_strength_display)
         self.audio_strength_timer.start(50)  # Update every 50ms for smooth display
         
         # Error and status management
         self.error_manager = error_manager
-        self.active_notifications = []
+        self._leave_dialog = None  # open "Leave Session" question, if any
         self.status_update_timer = QTimer()
         self.status_update_timer.timeout.connect(self._update_feature_status)
         self.status_update_timer.start(2000)  # Update every 2 seconds
         
         self.setWindowTitle(f"LAN Communicator - {username}")
         self.resize(1200, 800)
+        self.setStyleSheet(MAINAPP_QSS)
         self.setup_ui()
         self._setup_error_handling()
         logger.info(f"MainAppWindow initialized for user '{username}' in session '{session_id}'")
+        if turbo_jpeg is None and cv2 is None:
+            logger.warning(f"Video frames will be decoded with the {JPEG_DECODER}; install PyTurboJPEG or OpenCV for faster decoding")
+        else:
+            logger.info(f"Video frames will be decoded with {JPEG_DECODER}")
     
     def notify_media_state_change(self, media_type: str, is_active: bool):
         """Notify other users about media state changes."""
@@ -454,21 +1113,9 @@ class MainAppWindow(QMainWindow):
         """Handle window resize events to update grid layout."""
         super().resizeEvent(event)
         
-        # Prevent infinite resize loops by checking if size actually changed significantly
-        if hasattr(self, 'user_grid_layout') and hasattr(self, '_last_resize_size'):
-            old_size = self._last_resize_size
-            new_size = (event.size().width(), event.size().height())
-            
-            # Only recreate grid if size changed by more than 50 pixels in either dimension
-            width_diff = abs(new_size[0] - old_size[0])
-            height_diff = abs(new_size[1] - old_size[1])
-            
-            if width_diff > 50 or height_diff > 50:
-                self._last_resize_size = new_size
-                self._schedule_grid_update()
-        elif hasattr(self, 'user_grid_layout'):
-            # First resize event
-            self._last_resize_size = (event.size().width(), event.size().height())
+        # Dragging emits many resize events; they fold into the pending grid update, which
+        # reads tile sizes from content_area when it runs
+        if hasattr(self, '_grid_update_timer'):
             self._schedule_grid_update()
     
     def setup_ui(self):
@@ -521,13 +1168,7 @@ class MainAppWindow(QMainWindow):
         """Create chat sidebar with chat and file sharing."""
         sidebar = QWidget()
         sidebar.setFixedWidth(350)  # Fixed width sidebar
-        sidebar.setStyleSheet("""
-            QWidget {
-                background-color: #4a4a4a;
-                border-left: 1px solid #333;
-                color: white;
-            }
-        """)
+        sidebar.setObjectName("Sidebar")
         
         layout = QVBoxLayout(sidebar)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -536,13 +1177,7 @@ class MainAppWindow(QMainWindow):
         # Sidebar header with close button only
         header = QWidget()
         header.setFixedHeight(40)
-        header.setStyleSheet("""
-            QWidget {
-                background-color: #3a3a3a;
-                border-bottom: 1px solid #555;
-                color: white;
-            }
-        """)
+        header.setObjectName("SidebarHeader")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(10, 5, 10, 5)
         
@@ -552,20 +1187,7 @@ class MainAppWindow(QMainWindow):
         # Close button
         close_btn = QPushButton("✕")
         close_btn.setFixedSize(30, 30)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-                color: white;
-                border-radius: 15px;
-            }
-            QPushButton:hover {
-                background-color: #555;
-                color: white;
-            }
-        """)
+        close_btn.setObjectName("SidebarCloseBtn")
         close_btn.clicked.connect(self.hide_chat_sidebar)
         header_layout.addWidget(close_btn)
         
@@ -573,49 +1195,43 @@ class MainAppWindow(QMainWindow):
         
         # Tab widget for chat and files
         self.sidebar_tabs = QTabWidget()
-        self.sidebar_tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background-color: #4a4a4a;
-            }
-            QTabBar::tab {
-                background-color: #5a5a5a;
-                color: white;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #3a3a3a;
-                color: white;
-                border-bottom: 2px solid #007bff;
-            }
-        """)
+        self.sidebar_tabs.setObjectName("SidebarTabs")
+        self.sidebar_tabs.tabBar().setObjectName("SidebarTabBar")
         
         # Chat tab
         chat_tab = self.create_chat_content()
         self.sidebar_tabs.addTab(chat_tab, "Chat")
         
-        # Files tab
-        files_tab = self.create_files_content()
-        self.sidebar_tabs.addTab(files_tab, "Files")
+        # Files tab (built the first time it is opened)
+        self._files_tab_placeholder = QWidget()
+        self._files_tab_placeholder.setObjectName("SidebarContent")
+        self.sidebar_tabs.addTab(self._files_tab_placeholder, "Files")
+        self.sidebar_tabs.currentChanged.connect(self._on_sidebar_tab_changed)
         
         layout.addWidget(self.sidebar_tabs)
         
         return sidebar
     
+    def _on_sidebar_tab_changed(self, index: int):
+        """Replace the files tab placeholder with the real tab on first visit."""
+        if self._files_tab_placeholder is None or self.sidebar_tabs.widget(index) is not self._files_tab_placeholder:
+            return
+        
+        files_tab = self.create_files_content()
+        self.sidebar_tabs.blockSignals(True)
+        self.sidebar_tabs.removeTab(index)
+        self.sidebar_tabs.insertTab(index, files_tab, "Files")
+        self.sidebar_tabs.setCurrentIndex(index)
+        self.sidebar_tabs.blockSignals(False)
+        
+        self._files_tab_placeholder.deleteLater()
+        self._files_tab_placeholder = None
+    
     def create_users_sidebar(self) -> QWidget:
         """Create users sidebar with active users list."""
         sidebar = QWidget()
         sidebar.setFixedWidth(300)  # Fixed width sidebar
-        sidebar.setStyleSheet("""
-            QWidget {
-                background-color: #4a4a4a;
-                border-left: 1px solid #333;
-                color: white;
-            }
-        """)
+        sidebar.setObjectName("Sidebar")
         
         layout = QVBoxLayout(sidebar)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -624,13 +1240,7 @@ class MainAppWindow(QMainWindow):
         # Sidebar header with close button only
         header = QWidget()
         header.setFixedHeight(40)
-        header.setStyleSheet("""
-            QWidget {
-                background-color: #3a3a3a;
-                border-bottom: 1px solid #555;
-                color: white;
-            }
-        """)
+        header.setObjectName("SidebarHeader")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(10, 5, 10, 5)
         
@@ -640,20 +1250,7 @@ class MainAppWindow(QMainWindow):
         # Close button
         close_btn = QPushButton("✕")
         close_btn.setFixedSize(30, 30)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-                color: white;
-                border-radius: 15px;
-            }
-            QPushButton:hover {
-                background-color: #555;
-                color: white;
-            }
-        """)
+        close_btn.setObjectName("SidebarCloseBtn")
         close_btn.clicked.connect(self.hide_users_sidebar)
         header_layout.addWidget(close_btn)
         
@@ -661,46 +1258,22 @@ class MainAppWindow(QMainWindow):
         
         # Users list content
         users_content = QWidget()
+        users_content.setObjectName("SidebarContent")
         users_layout = QVBoxLayout(users_content)
         users_layout.setContentsMargins(15, 15, 15, 15)
         users_layout.setSpacing(10)
         
         # Active users label
         users_label = QLabel("Active Users")
-        users_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-weight: bold;
-                color: #212529;
-                margin-bottom: 10px;
-            }
-        """)
+        users_label.setObjectName("UsersHeading")
         users_layout.addWidget(users_label)
         
-        # Users list widget
-        self.users_list_widget = QListWidget()
-        self.users_list_widget.setStyleSheet("""
-            QListWidget {
-                background-color: #2a2a2a;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 5px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #555;
-                border-radius: 4px;
-                margin: 2px 0;
-                color: white;
-            }
-            QListWidget::item:hover {
-                background-color: #3a3a3a;
-            }
-            QListWidget::item:selected {
-                background-color: #007bff;
-                color: white;
-            }
-        """)
+        # Users list view
+        self.users_list_model = UsersListModel(self)
+        self.users_list_widget = QListView()
+        self.users_list_widget.setModel(self.users_list_model)
+        self.users_list_widget.setUniformItemSizes(True)
+        self.users_list_widget.setObjectName("UsersList")
         users_layout.addWidget(self.users_list_widget)
         
         users_layout.addStretch()
@@ -712,24 +1285,41 @@ class MainAppWindow(QMainWindow):
     def create_chat_content(self) -> QWidget:
         """Create chat content for sidebar."""
         widget = QWidget()
+        widget.setObjectName("SidebarContent")
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(10, 10, 10, 10)
         
         # Chat history
         self.chat_display = QTextEdit()
         self.chat_display.setReadOnly(True)
-        self.chat_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #2a2a2a;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 10px;
-                font-size: 13px;
-                color: white;
-            }
-        """)
+        self.chat_display.setObjectName("ChatDisplay")
+        # Each message is one block; cap them so inserts and layout stay cheap in long sessions
+        self.chat_display.document().setMaximumBlockCount(MAX_CHAT_MESSAGES)
         layout.addWidget(self.chat_display)
         
+        # Messages are inserted through a private cursor with pre-built formats (no HTML parsing)
+        self._chat_cursor = QTextCursor(self.chat_display.document())
+        self._chat_block_formats = {}
+        self._chat_name_formats = {}
+        for direction, alignment, color in (("sent", Qt.AlignRight, "#2196F3"), ("received", Qt.AlignLeft, "#4CAF50")):
+            block_format = QTextBlockFormat()
+            block_format.setAlignment(alignment)
+            block_format.setTopMargin(5)
+            block_format.setBottomMargin(5)
+            block_format.setLeftMargin(5)
+            block_format.setRightMargin(5)
+            self._chat_block_formats[direction] = block_format
+            
+            name_format = QTextCharFormat()
+            name_format.setFontWeight(QFont.Bold)
+            name_format.setForeground(QColor(color))
+            self._chat_name_formats[direction] = name_format
+        
+        self._chat_timestamp_format = QTextCharFormat()
+        self._chat_timestamp_format.setForeground(QColor("gray"))
+        self._chat_timestamp_format.setProperty(QTextFormat.FontPixelSize, 10)
+        self._chat_body_format = QTextCharFormat()
+        
         # Input area
         input_layout = QVBoxLayout()
         
@@ -737,33 +1327,13 @@ class MainAppWindow(QMainWindow):
         self.chat_input.setPlaceholderText("Type your message...")
         self.chat_input.returnPressed.connect(self.handle_send_message)
         self.chat_input.setMinimumHeight(35)
-        self.chat_input.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 13px;
-                background-color: #2a2a2a;
-                color: white;
-            }
-        """)
+        self.chat_input.setObjectName("ChatInput")
         input_layout.addWidget(self.chat_input)
         
         send_btn = QPushButton("Send Message")
         send_btn.setMinimumHeight(35)
         send_btn.clicked.connect(self.handle_send_message)
-        send_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                font-weight: bold;
-                border-radius: 4px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-        """)
+        send_btn.setObjectName("SendBtn")
         input_layout.addWidget(send_btn)
         
         layout.addLayout(input_layout)
@@ -773,108 +1343,50 @@ class MainAppWindow(QMainWindow):
     def create_files_content(self) -> QWidget:
         """Create files content for sidebar."""
         widget = QWidget()
+        widget.setObjectName("SidebarContent")
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
         
         # Upload section
         upload_group = QGroupBox("Share File")
-        upload_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #555;
-                border-radius: 4px;
-                margin-top: 10px;
-                padding-top: 10px;
-                color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: white;
-            }
-        """)
+        upload_group.setObjectName("ShareFileGroup")
         upload_layout = QVBoxLayout(upload_group)
         
         self.selected_file_label = QLabel("No file selected")
-        self.selected_file_label.setStyleSheet("color: #ccc; font-size: 12px;")
+        self.selected_file_label.setObjectName("SelectedFileLabel")
         upload_layout.addWidget(self.selected_file_label)
         
         browse_btn = QPushButton("Browse Files...")
         browse_btn.clicked.connect(self.handle_browse_file)
-        browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #545b62;
-            }
-        """)
+        browse_btn.setObjectName("BrowseBtn")
         upload_layout.addWidget(browse_btn)
         
         upload_btn = QPushButton("Share File")
         upload_btn.clicked.connect(self.handle_upload_file)
-        upload_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                font-weight: bold;
-                padding: 8px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
+        upload_btn.setObjectName("ShareBtn")
         upload_layout.addWidget(upload_btn)
         
         layout.addWidget(upload_group)
         
         # Available files list
         files_label = QLabel("Shared Files")
-        files_label.setStyleSheet("font-weight: bold; margin-top: 10px; color: white;")
+        files_label.setObjectName("FilesHeading")
         layout.addWidget(files_label)
         
-        self.files_list_widget = QListWidget()
-        self.files_list_widget.itemDoubleClicked.connect(self.handle_download_file)
-        self.files_list_widget.setStyleSheet("""
-            QListWidget {
-                border: 1px solid #555;
-                border-radius: 4px;
-                background-color: #2a2a2a;
-                color: white;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #555;
-            }
-            QListWidget::item:hover {
-                background-color: #3a3a3a;
-            }
-        """)
+        self.files_list_widget = QListView()
+        self.files_list_widget.setModel(self.files_model)
+        self.files_list_widget.setUniformItemSizes(True)
+        self.files_list_widget.setLayoutMode(QListView.Batched)
+        self.files_list_widget.setBatchSize(100)
+        self.files_list_widget.doubleClicked.connect(self.handle_download_file)
+        self.files_list_widget.setObjectName("FilesList")
         layout.addWidget(self.files_list_widget)
         
         # Download button
         download_btn = QPushButton("Download Selected")
         download_btn.clicked.connect(self.handle_download_file)
-        download_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                padding: 8px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-        """)
+        download_btn.setObjectName("DownloadBtn")
         layout.addWidget(download_btn)
         
         # Transfer progress
@@ -884,84 +1396,12 @@ class MainAppWindow(QMainWindow):
         
         return widget
     
-    def create_files_tab_old(self) -> QWidget:
-        """Create file transfer tab."""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(10)
-        
-        # Upload section
-        upload_group = QGroupBox("Upload File")
-        upload_layout = QHBoxLayout(upload_group)
-        
-        self.selected_file_label = QLabel("No file selected")
-        self.selected_file_label.setStyleSheet("color: gray;")
-        upload_layout.addWidget(self.selected_file_label)
-        
-        browse_btn = QPushButton("Browse...")
-        browse_btn.clicked.connect(self.handle_browse_file)
-        upload_layout.addWidget(browse_btn)
-        
-        upload_btn = QPushButton("Upload")
-        upload_btn.clicked.connect(self.handle_upload_file)
-        upload_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                padding: 8px 20px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
-        upload_layout.addWidget(upload_btn)
-        
-        layout.addWidget(upload_group)
-        
-        # Available files list
-        files_label = QLabel("Available Files")
-        files_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
-        layout.addWidget(files_label)
-        
-        self.files_list_widget = QListWidget()
-        self.files_list_widget.itemDoubleClicked.connect(self.handle_download_file)
-        layout.addWidget(self.files_list_widget)
-        
-        # Download button
-        download_btn = QPushButton("Download Selected")
-        download_btn.clicked.connect(self.handle_download_file)
-        download_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                padding: 8px;
-            }
-        """)
-        layout.addWidget(download_btn)
-        
-        # Transfer progress
-        self.transfer_progress = QProgressBar()
-        self.transfer_progress.setVisible(False)
-        layout.addWidget(self.transfer_progress)
-        
-        return tab
-    
     def create_unified_media_view(self) -> QWidget:
         """Create unified view with all users and presentations in one area."""
         widget = QWidget()
         
-        # Set dark background like Google Meet, but exclude UserBox
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: #202124;
-                color: white;
-            }
-            UserBox {
-                background-color: none;
-            }
-        """)
+        # Dark background like Google Meet (see MAINAPP_QSS)
+        widget.setObjectName("MediaView")
         
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -969,15 +1409,7 @@ class MainAppWindow(QMainWindow):
         
         # Main content area with users and presentations
         self.content_area = QWidget()
-        self.content_area.setStyleSheet("""
-            QWidget {
-                background-color: #202124;
-                border: none;
-            }
-            UserBox {
-                background-color: none;
-            }
-        """)
+        self.content_area.setObjectName("ContentArea")
         self.content_layout = QGridLayout(self.content_area)
         # Increased spacing between profile boxes and added margins from window edges
         self.content_layout.setSpacing(15)  # Gap between profile boxes
@@ -986,12 +1418,37 @@ class MainAppWindow(QMainWindow):
         # Initialize user and presentation management
         self.user_boxes = {}  # username -> UserBox widget
         self.presentation_boxes = {}  # username -> PresentationBox widget
-        self.user_order = []  # List of usernames in display order
+        self.user_order = OrderedDict()  # usernames in display order (values unused); O(1) membership and removal
+        self.current_page = 0
+        self.prev_page_btn = self.next_page_btn = self.page_label = None  # pagination is not built (dynamic grid)
+        self.users_per_page = GRID_DIMENSIONS[-1][0] * GRID_DIMENSIONS[-1][1]  # tiles in the largest grid
         self._grid_updating = False  # Flag to prevent recursive grid updates
+        self._grid_dirty = False  # connected_users changed since the last grid sync
+        self._grid_positions = {}  # widget -> (row, col) it currently occupies in content_layout
+        self._visible_users = set()  # usernames whose box is placed in the grid; others' video is not decoded
+        self._grid_stretch = (0, 0)  # (rows, cols) that currently have stretch 1
         self._grid_update_timer = QTimer()  # Timer for debouncing grid updates
         self._grid_update_timer.setSingleShot(True)
         self._grid_update_timer.timeout.connect(self._delayed_grid_update)
         
+        # Video frames are decoded off the GUI thread and delivered back queued
+        self._decode_pool = QThreadPool.globalInstance()
+        self._decode_pool.setMaxThreadCount(max(1, os.cpu_count() or 1))
+        self._frame_signals = FrameDecodeSignals()
+        self._pending_frames = {}  # username -> newest undecoded (frame_data, target_size)
+        self._video_target_sizes = {}  # username -> (width, height) of the video tile
+        self._decoding = set()  # usernames with a decode worker running
+        self._frame_lock = threading.Lock()
+        self._last_frame_hash = {}  # username -> hash of the last frame received
+        self._last_frame_pixmap = {}  # username -> last displayed frame (implicitly shared QPixmap)
+        self._frame_signals.frame_ready.connect(self._display_user_video, Qt.QueuedConnection)
+        
+        # Screen share frames go through the same pool with their own queue
+        self._screen_signals = FrameDecodeSignals()
+        self._pending_screens = {}  # username -> newest undecoded (frame_data, target_size)
+        self._screen_decoding = set()  # usernames with a screen decode worker running
+        self._screen_signals.frame_ready.connect(self._display_screen_frame, Qt.QueuedConnection)
+        
         # Create initial empty state
         self._create_dynamic_grid()
         
@@ -1006,12 +1463,7 @@ class MainAppWindow(QMainWindow):
         """Create bottom control bar with new layout: session ID (left), controls (center), users/chat (right)."""
         controls_container = QWidget()
         controls_container.setFixedHeight(80)
-        controls_container.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-                border-top: 1px solid #333;
-            }
-        """)
+        controls_container.setObjectName("ControlsBar")
         
         controls_layout = QHBoxLayout(controls_container)
         controls_layout.setContentsMargins(20, 15, 20, 15)
@@ -1022,23 +1474,7 @@ class MainAppWindow(QMainWindow):
         
         # Session ID button
         self.session_btn = QPushButton(f"Session: {self.session_id}")
-        self.session_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c4043;
-                border: none;
-                border-radius: 6px;
-                font-size: 12px;
-                color: white;
-                padding: 8px 12px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #5f6368;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """)
+        self.session_btn.setObjectName("SessionBtn")
         self.session_btn.clicked.connect(self.toggle_session_info)
         left_layout.addWidget(self.session_btn)
         
@@ -1054,6 +1490,7 @@ class MainAppWindow(QMainWindow):
         # Audio button (initially OFF)
         self.audio_btn = QPushButton()
         self.audio_btn.setFixedSize(50, 50)
+        self.audio_btn.setObjectName("MediaToggleBtn")
         self.audio_btn.clicked.connect(self.toggle_audio)
         # Set initial OFF state with SVG icon
         set_button_icon(self.audio_btn, MICROPHONE_SVG, False)
@@ -1062,6 +1499,7 @@ class MainAppWindow(QMainWindow):
         # Video button (initially OFF)
         self.video_btn = QPushButton()
         self.video_btn.setFixedSize(50, 50)
+        self.video_btn.setObjectName("MediaToggleBtn")
         self.video_btn.clicked.connect(self.toggle_video)
         # Set initial OFF state with SVG icon
         set_button_icon(self.video_btn, VIDEO_SVG, False)
@@ -1070,6 +1508,7 @@ class MainAppWindow(QMainWindow):
         # Screen share button (initially OFF)
         self.screen_share_btn = QPushButton()
         self.screen_share_btn.setFixedSize(50, 50)
+        self.screen_share_btn.setObjectName("MediaToggleBtn")
         self.screen_share_btn.clicked.connect(self.toggle_screen_share)
         # Set initial OFF state with SVG icon
         set_button_icon(self.screen_share_btn, SCREEN_SHARE_SVG, False)
@@ -1080,23 +1519,10 @@ class MainAppWindow(QMainWindow):
         self.end_session_btn.setFixedSize(50, 50)
         self.end_session_btn.clicked.connect(self.handle_leave_session)
         # Set hangup icon with red background
-        from gui.icons import create_svg_icon
         hangup_icon = create_svg_icon(PHONE_HANGUP_SVG, QSize(24, 24), "white")
         self.end_session_btn.setIcon(hangup_icon)
         self.end_session_btn.setIconSize(QSize(24, 24))
-        self.end_session_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ea4335;
-                border: none;
-                border-radius: 25px;
-            }
-            QPushButton:hover {
-                background-color: #d33b2c;
-            }
-            QPushButton:pressed {
-                background-color: #b52d20;
-            }
-        """)
+        self.end_session_btn.setObjectName("EndSessionBtn")
         center_layout.addWidget(self.end_session_btn)
         
         controls_layout.addLayout(center_layout)
@@ -1116,19 +1542,7 @@ class MainAppWindow(QMainWindow):
         users_icon = create_svg_icon(USERS_SVG, QSize(24, 24), "white")
         self.users_btn.setIcon(users_icon)
         self.users_btn.setIconSize(QSize(24, 24))
-        self.users_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c4043;
-                border: none;
-                border-radius: 25px;
-            }
-            QPushButton:hover {
-                background-color: #5f6368;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """)
+        self.users_btn.setObjectName("RoundIconBtn")
         right_layout.addWidget(self.users_btn)
         
         # Chat button
@@ -1139,19 +1553,7 @@ class MainAppWindow(QMainWindow):
         chat_icon = create_svg_icon(CHAT_SVG, QSize(24, 24), "white")
         self.chat_btn.setIcon(chat_icon)
         self.chat_btn.setIconSize(QSize(24, 24))
-        self.chat_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c4043;
-                border: none;
-                border-radius: 25px;
-            }
-            QPushButton:hover {
-                background-color: #5f6368;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """)
+        self.chat_btn.setObjectName("RoundIconBtn")
         right_layout.addWidget(self.chat_btn)
         
         controls_layout.addLayout(right_layout)
@@ -1180,17 +1582,17 @@ class MainAppWindow(QMainWindow):
         # Add separator
         separator = QFrame()
         separator.setFrameShape(QFrame.VLine)
-        separator.setStyleSheet("color: #ccc;")
+        separator.setObjectName("StatusSeparator")
         self.status_bar.addWidget(separator)
         
         # User info
         user_label = QLabel(f"User: {self.username}")
-        user_label.setStyleSheet("font-size: 10px; color: #666;")
+        user_label.setObjectName("StatusInfoLabel")
         self.status_bar.addWidget(user_label)
         
         # Session info
         session_label = QLabel(f"Session: {self.session_id}")
-        session_label.setStyleSheet("font-size: 10px; color: #666;")
+        session_label.setObjectName("StatusInfoLabel")
         self.status_bar.addWidget(session_label)
     
     # ========================================================================
@@ -1210,16 +1612,9 @@ class MainAppWindow(QMainWindow):
         
         self.connected_users[username] = user_info
         
-        # Add to user grid
-        self.add_user_to_grid(username, user_info)
-        
-        # Update users sidebar if it exists
-        if hasattr(self, 'users_list_widget'):
-            self.update_users_list()
-        
-        # Update session details
-        if hasattr(self, 'session_details'):
-            self.update_session_details()
+        # Grid, users sidebar and session details are reconciled once per debounce tick
+        self._grid_dirty = True
+        self._schedule_grid_update()
         
         logger.info(f"Added user '{username}' to user list and grid")
     
@@ -1228,16 +1623,9 @@ class MainAppWindow(QMainWindow):
         if username in self.connected_users:
             del self.connected_users[username]
         
-        # Remove from user grid
-        self.remove_user_from_grid(username)
-        
-        # Update users sidebar if it exists
-        if hasattr(self, 'users_list_widget'):
-            self.update_users_list()
-        
-        # Update session details
-        if hasattr(self, 'session_details'):
-            self.update_session_details()
+        # Grid, users sidebar and session details are reconciled once per debounce tick
+        self._grid_dirty = True
+        self._schedule_grid_update()
         
         logger.info(f"Removed user '{username}' from user list and grid")
         
@@ -1300,19 +1688,25 @@ class MainAppWindow(QMainWindow):
             direction: 'sent' or 'received'
         """
         timestamp = datetime.now().strftime("%H:%M:%S")
+        direction = "sent" if direction == "sent" else "received"
         
-        if direction == "sent":
-            html = f'<div style="text-align: right; margin: 5px;">' \
-                   f'<span style="color: gray; font-size: 10px;">{timestamp}</span><br>' \
-                   f'<b style="color: #2196F3;">{sender}:</b> {message}' \
-                   f'</div>'
+        # Keep following new messages only if the view is already scrolled to the bottom
+        scroll_bar = self.chat_display.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        
+        cursor = self._chat_cursor
+        cursor.movePosition(QTextCursor.End)
+        if self.chat_display.document().isEmpty():
+            cursor.setBlockFormat(self._chat_block_formats[direction])
         else:
-            html = f'<div style="text-align: left; margin: 5px;">' \
-                   f'<span style="color: gray; font-size: 10px;">{timestamp}</span><br>' \
-                   f'<b style="color: #4CAF50;">{sender}:</b> {message}' \
-                   f'</div>'
+            cursor.insertBlock(self._chat_block_formats[direction])
+        cursor.insertText(timestamp, self._chat_timestamp_format)
+        cursor.insertText("\u2028", self._chat_body_format)  # Line break within the message block
+        cursor.insertText(f"{sender}:", self._chat_name_formats[direction])
+        cursor.insertText(f" {message}", self._chat_body_format)
         
-        self.chat_display.append(html)
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
     
     # ========================================================================
     # File Transfer Methods
@@ -1323,9 +1717,24 @@ class MainAppWindow(QMainWindow):
         """Handle file browse button."""
         file_path, _ = QFileDialog.getOpenFileName(self, "Select File to Upload")
         if file_path:
+            # One stat up front; the upload path reuses the cached name
+            try:
+                file_stat = os.stat(file_path)
+            except OSError as e:
+                logger.error(f"Cannot access selected file {file_path}: {e}")
+                self.error_manager.report_error(
+                    category=ErrorCategory.FILE_TRANSFER,
+                    error_type='file_not_found',
+                    severity=ErrorSeverity.ERROR,
+                    component='file_transfer',
+                    details=f"File not found: {file_path}"
+                )
+                return
+            
             self.selected_file_path = file_path
-            self.selected_file_label.setText(os.path.basename(file_path))
-            logger.info(f"Selected file: {file_path}")
+            self._selected_file_name = os.path.basename(file_path)
+            self.selected_file_label.setText(self._selected_file_name)
+            logger.info(f"Selected file: {file_path} ({file_stat.st_size} bytes)")
     
     @Slot()
     def handle_upload_file(self):
@@ -1340,8 +1749,9 @@ class MainAppWindow(QMainWindow):
                 )
                 return
             
-            # Check if file still exists
-            if not os.path.exists(self.selected_file_path):
+            # The file may have been removed since it was selected; fail with the specific error
+            # before announcing the upload
+            if not os.path.isfile(self.selected_file_path):
                 self.error_manager.report_error(
                     category=ErrorCategory.FILE_TRANSFER,
                     error_type='file_not_found',
@@ -1371,8 +1781,7 @@ class MainAppWindow(QMainWindow):
             self.error_manager.update_component_status('file_transfer', 'processing', 'Starting file upload...')
             self.upload_file.emit(self.selected_file_path, mode, targets)
             
-            filename = os.path.basename(self.selected_file_path)
-            self.show_success_notification("Upload Started", f"Uploading {filename}...")
+            self.show_success_notification("Upload Started", f"Uploading {self._selected_file_name}...")
             logger.info(f"Uploading file: {self.selected_file_path}")
             
         except Exception as e:
@@ -1389,7 +1798,7 @@ class MainAppWindow(QMainWindow):
     def handle_download_file(self):
         """Handle file download button with enhanced error handling."""
         try:
-            selected_items = self.files_list_widget.selectedItems()
+            selected_items = self.files_list_widget.selectionModel().selectedIndexes()
             if not selected_items:
                 self.error_manager.report_error(
                     category=ErrorCategory.USER_INPUT,
@@ -1413,7 +1822,7 @@ class MainAppWindow(QMainWindow):
             self.error_manager.update_component_status('file_transfer', 'processing', 'Starting file download...')
             self.download_file.emit(file_id)
             
-            filename = selected_items[0].text().split(' (')[0]  # Extract filename from display text
+            filename = selected_items[0].data(AvailableFilesModel.FilenameRole)
             self.show_success_notification("Download Started", f"Downloading {filename}...")
             logger.info(f"Downloading file: {file_id}")
             
@@ -1440,10 +1849,7 @@ class MainAppWindow(QMainWindow):
             'uploader': uploader
         }
         
-        size_mb = size / (1024 * 1024)
-        item = QListWidgetItem(f"{filename} ({size_mb:.2f} MB) - from {uploader}")
-        item.setData(Qt.UserRole, file_id)
-        self.files_list_widget.addItem(item)
+        self.files_model.add_file(file_id, filename, size, uploader)
         logger.info(f"Added available file: {filename}")
     
     # ========================================================================
@@ -1563,127 +1969,62 @@ class MainAppWindow(QMainWindow):
         """Update screen share button appearance based on state."""
         set_button_icon(self.screen_share_btn, SCREEN_SHARE_SVG, is_active)
     
-    def add_placeholder_video(self, label: str):
-        """Add a placeholder video frame to the grid."""
-        # Calculate grid position
-        count = self.video_layout.count()
-        row = count // 2
-        col = count % 2
-        
-        frame = QLabel(label)
-        frame.setAlignment(Qt.AlignCenter)
-        frame.setStyleSheet("""
-            QLabel {
-                background-color: #333;
-                color: white;
-                border: 2px solid #555;
-                min-height: 240px;
-                font-size: 16px;
-            }
-        """)
-        frame.setMinimumSize(320, 240)
+    def _display_user_video(self, username: str):
+        """Display the newest decoded video frame for a user (runs on the GUI thread)."""
+        image = self._frame_signals.take_frame(username)
+        if image is None:
+            return
         
-        self.video_layout.addWidget(frame, row, col)
+        # Convert once; repaints hand the same implicitly shared pixmap to the widget
+        pixmap = QPixmap.fromImage(image)
+        self._last_frame_pixmap[username] = pixmap
+        self._show_user_pixmap(username, pixmap)
     
-    def update_video_frame(self, username: str, frame_data: bytes):
-        """
-        Update video frame for a user.
-        
-        Args:
-            username: Username
-            frame_data: JPEG frame data
-        """
-        try:
-            # Decode JPEG frame data
-            import numpy as np
-            from PySide6.QtGui import QPixmap
-            
-            # Convert bytes to numpy array
-            nparr = np.frombuffer(frame_data, np.uint8)
-            
-            # Try to import cv2 for decoding
-            try:
-                import cv2
-                # Decode JPEG
-                frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-                if frame is not None:
-                    # Convert BGR to RGB
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    # Convert to QImage
-                    height, width, channel = frame_rgb.shape
-                    bytes_per_line = 3 * width
-                    q_image = QImage(frame_rgb.data, width, height, bytes_per_line, QImage.Format_RGB888)
-                    
-                    # Convert to QPixmap and display
-                    pixmap = QPixmap.fromImage(q_image)
-                    self._display_user_video(username, pixmap)
-                else:
-                    logger.warning(f"Failed to decode video frame from {username}")
-            except ImportError:
-                logger.warning("OpenCV not available for video decoding")
-                
-        except Exception as e:
-            logger.error(f"Error updating video frame for {username}: {e}")
-    
-    def _display_user_video(self, username: str, pixmap: QPixmap):
-        """Display video frame for a user in the video grid."""
-        # Find or create video label for this user
-        video_label = None
-        
-        # Search for existing label
-        for i in range(self.video_layout.count()):
-            item = self.video_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if hasattr(widget, 'username') and widget.username == username:
-                    video_label = widget
-                    break
-        
-        # Create new label if not found
-        if not video_label:
-            video_label = QLabel()
-            video_label.username = username
-            video_label.setAlignment(Qt.AlignCenter)
-            video_label.setStyleSheet("""
-                QLabel {
-                    background-color: #000;
-                    border: 2px solid #555;
-                    min-height: 240px;
-                }
-            """)
-            video_label.setMinimumSize(320, 240)
-            video_label.setScaledContents(True)
-            
-            # Add to grid
-            count = self.video_layout.count()
-            row = count // 2
-            col = count % 2
-            self.video_layout.addWidget(video_label, row, col)
-            
-            logger.info(f"Created video display for user {username}")
-        
-        # Scale pixmap to fit label while maintaining aspect ratio
-        scaled_pixmap = pixmap.scaled(
-            video_label.size(), 
-            Qt.KeepAspectRatio, 
-            Qt.SmoothTransformation
-        )
-        
-        # Update the label
-        video_label.setPixmap(scaled_pixmap)
+    def _show_user_pixmap(self, username: str, pixmap: QPixmap):
+        """Show an already converted video frame in a user's box."""
+        if username in self.user_boxes:
+            self.user_boxes[username].set_video_pixmap(pixmap)
+        else:
+            logger.warning(f"No user box found for {username}")
+            # Try to create the user box if it doesn't exist
+            if username == self.username and (self.audio_active or self.video_active):
+                logger.info(f"Creating user box for self ({username}) since media is active")
+                self._schedule_grid_update()
     
     def remove_user_video(self, username: str):
-        """Remove video display for a user."""
-        for i in range(self.video_layout.count()):
-            item = self.video_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if hasattr(widget, 'username') and widget.username == username:
-                    self.video_layout.removeWidget(widget)
-                    widget.deleteLater()
-                    logger.info(f"Removed video display for user {username}")
-                    break
+        """Drop the per-user video state of a user who left (their UserBox goes with the grid sync)."""
+        with self._frame_lock:
+            # A running decode worker finds nothing pending and stops
+            self._pending_frames.pop(username, None)
+        self._frame_signals.discard(username)
+        self._video_target_sizes.pop(username, None)
+        self._last_frame_hash.pop(username, None)
+        if self._last_frame_pixmap.pop(username, None) is not None:
+            logger.info(f"Removed video display for user {username}")
+    
+    def clear_all_video(self):
+        """Drop every remote video tile and all per-user frame state in one pass."""
+        with self._frame_lock:
+            self._pending_frames.clear()
+            self._pending_screens.clear()
+        self._frame_signals.discard()
+        self._screen_signals.discard()
+        self._video_target_sizes.clear()
+        self._last_frame_hash.clear()
+        self._last_frame_pixmap.clear()
+        self._visible_users.clear()
+        
+        # Detach all tiles with repaints suspended so the grid is invalidated once
+        self.content_area.setUpdatesEnabled(False)
+        try:
+            for box in [*self.user_boxes.values(), *self.presentation_boxes.values()]:
+                self._grid_positions.pop(box, None)
+                self.content_layout.removeWidget(box)
+                box.deleteLater()
+            self.user_boxes.clear()
+            self.presentation_boxes.clear()
+        finally:
+            self.content_area.setUpdatesEnabled(True)
     
     def update_screen_frame(self, username: str, frame_data: bytes, width: int = 0, height: int = 0):
         """
@@ -1699,9 +2040,38 @@ class MainAppWindow(QMainWindow):
         if username not in self.presentation_boxes:
             self.add_presentation_box(username)
         
-        # Update the presentation box with the screen frame
-        if username in self.presentation_boxes:
+        if not frame_data:
+            with self._frame_lock:
+                self._pending_screens.pop(username, None)
+            self._screen_signals.discard(username)
             self.presentation_boxes[username].set_screen_frame(frame_data, width, height)
+            return
+        
+        screen_size = self.presentation_boxes[username].screen_area.size()
+        target_size = (screen_size.width(), screen_size.height()) if not screen_size.isEmpty() else None
+        with self._frame_lock:
+            # Only the newest undecoded frame is kept; older ones are dropped
+            self._pending_screens[username] = (frame_data, target_size)
+            if username in self._screen_decoding:
+                return
+            self._screen_decoding.add(username)
+        
+        # Decode on the thread pool; the result comes back through _display_screen_frame
+        self._decode_pool.start(FrameDecodeRunnable(self._screen_signals, username, self._take_pending_screen))
+    
+    def _take_pending_screen(self, username: str):
+        """Pop the newest pending screen (frame_data, target_size) for a user (called from decode workers)."""
+        with self._frame_lock:
+            pending = self._pending_screens.pop(username, None)
+            if pending is None:
+                self._screen_decoding.discard(username)
+            return pending
+    
+    def _display_screen_frame(self, username: str):
+        """Display the newest decoded screen share frame (runs on the GUI thread)."""
+        image = self._screen_signals.take_frame(username)
+        if image is not None and username in self.presentation_boxes:
+            self.presentation_boxes[username].set_screen_pixmap(QPixmap.fromImage(image))
     
     def update_screen_frame_old(self, frame_data: bytes, width: int = 0, height: int = 0):
         """
@@ -1723,14 +2093,29 @@ class MainAppWindow(QMainWindow):
     @Slot()
     def handle_leave_session(self):
         """Handle leave session button."""
-        reply = QMessageBox.question(
-            self, "Leave Session",
+        if self._leave_dialog is not None:
+            self._leave_dialog.raise_()
+            return
+        
+        # Window-modal and opened asynchronously instead of exec()'d, so the main event loop
+        # keeps delivering media while the question is up and no nested loop is spun
+        dialog = QMessageBox(
+            QMessageBox.Question, "Leave Session",
             "Are you sure you want to leave this session?",
-            QMessageBox.Yes | QMessageBox.No
+            QMessageBox.Yes | QMessageBox.No, self
         )
-        
+        dialog.setWindowModality(Qt.WindowModal)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.finished.connect(self._on_leave_session_reply)
+        self._leave_dialog = dialog
+        dialog.open()
+    
+    def _on_leave_session_reply(self, reply: int):
+        """Leave the session if the user confirmed the leave question."""
+        self._leave_dialog = None
         if reply == QMessageBox.Yes:
             logger.info(f"User '{self.username}' leaving session '{self.session_id}'")
+            self.clear_all_video()
             self.leave_session.emit()
     
     def toggle_chat_sidebar(self):
@@ -1756,92 +2141,31 @@ class MainAppWindow(QMainWindow):
     def show_chat_sidebar(self):
         """Show the chat sidebar."""
         self.chat_sidebar.setVisible(True)
-        self.chat_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007bff;
-                border: none;
-                border-radius: 25px;
-                font-size: 20px;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-        """)
+        set_style_state(self.chat_btn, "active", True)
     
     def hide_chat_sidebar(self):
         """Hide the chat sidebar."""
         self.chat_sidebar.setVisible(False)
-        self.chat_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c4043;
-                border: none;
-                border-radius: 25px;
-                font-size: 20px;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #5f6368;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """)
+        set_style_state(self.chat_btn, "active", False)
     
     def show_users_sidebar(self):
         """Show the users sidebar."""
         self.users_sidebar.setVisible(True)
-        self.users_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007bff;
-                border: none;
-                border-radius: 25px;
-                font-size: 20px;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-        """)
-        # Update users list
+        set_style_state(self.users_btn, "active", True)
+        # Joins/leaves already refresh the list from the debounced grid sync; this only
+        # resets the view if it is somehow out of date
         self.update_users_list()
     
     def hide_users_sidebar(self):
         """Hide the users sidebar."""
         self.users_sidebar.setVisible(False)
-        self.users_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c4043;
-                border: none;
-                border-radius: 25px;
-                font-size: 20px;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #5f6368;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """)
+        set_style_state(self.users_btn, "active", False)
     
     def create_session_info_popup(self):
         """Create session info popup widget."""
         self.session_info_popup = QWidget(self)
         self.session_info_popup.setFixedSize(250, 180)
-        self.session_info_popup.setStyleSheet("""
-            QWidget {
-                background-color: #fff;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-            }
-        """)
+        self.session_info_popup.setObjectName("SessionPopup")
         self.session_info_popup.setVisible(False)
         
         layout = QVBoxLayout(self.session_info_popup)
@@ -1850,38 +2174,25 @@ class MainAppWindow(QMainWindow):
         
         # Session details
         session_label = QLabel(f"Session ID: {self.session_id}")
-        session_label.setStyleSheet("font-weight: bold; color: #333;")
+        session_label.setObjectName("SessionPopupTitle")
         layout.addWidget(session_label)
         
         server_label = QLabel(f"Server Address: {self.server_address}")
-        server_label.setStyleSheet("color: #666;")
+        server_label.setObjectName("SessionPopupDetail")
         layout.addWidget(server_label)
         
         # TCP/UDP ports (will be updated when connected)
         self.tcp_port_label = QLabel("TCP Port: --")
-        self.tcp_port_label.setStyleSheet("color: #666;")
+        self.tcp_port_label.setObjectName("SessionPopupDetail")
         layout.addWidget(self.tcp_port_label)
         
         self.udp_port_label = QLabel("UDP Port: --")
-        self.udp_port_label.setStyleSheet("color: #666;")
+        self.udp_port_label.setObjectName("SessionPopupDetail")
         layout.addWidget(self.udp_port_label)
         
         # Copy button
         copy_btn = QPushButton("📋 Copy Info")
-        copy_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px;
-                font-weight: bold;
-                margin-top: 10px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-        """)
+        copy_btn.setObjectName("CopySessionBtn")
         copy_btn.clicked.connect(self.copy_session_info)
         layout.addWidget(copy_btn)
     
@@ -1890,55 +2201,29 @@ class MainAppWindow(QMainWindow):
         if self.session_info_popup.isVisible():
             self.session_info_popup.setVisible(False)
         else:
-            # Position popup above session button
-            session_btn_pos = self.session_btn.mapToGlobal(self.session_btn.rect().topLeft())
+            # Position popup above session button (mapped straight into window coordinates)
+            session_btn_pos = self.session_btn.mapTo(self, self.session_btn.rect().topLeft())
             popup_x = session_btn_pos.x()
             popup_y = session_btn_pos.y() - self.session_info_popup.height() - 10
             
-            # Convert to parent widget coordinates
-            parent_pos = self.mapFromGlobal(session_btn_pos)
-            popup_x = parent_pos.x()
-            popup_y = parent_pos.y() - self.session_info_popup.height() - 10
-            
             self.session_info_popup.move(popup_x, popup_y)
             self.session_info_popup.setVisible(True)
             self.session_info_popup.raise_()
     
-    def update_session_details(self):
-        """Update session details in users sidebar."""
-        if hasattr(self, 'session_details'):
-            details_text = f"""Session ID: {self.session_id}
-Server: {self.server_address}
-Role: {'Host' if self.is_host else 'Participant'}
-Users: {len(self.connected_users) + 1}"""
-            self.session_details.setText(details_text)
-    
     def update_users_list(self):
         """Update the users list in the sidebar."""
-        if hasattr(self, 'users_list_widget'):
-            self.users_list_widget.clear()
-            
-            # Add self first
-            self_item = QListWidgetItem(f"👤 {self.username} (You)")
-            self_item.setData(Qt.UserRole, self.username)
-            self.users_list_widget.addItem(self_item)
-            
-            # Add other users
-            for username in self.connected_users:
-                user_item = QListWidgetItem(f"👤 {username}")
-                user_item.setData(Qt.UserRole, username)
-                self.users_list_widget.addItem(user_item)
+        if hasattr(self, 'users_list_model'):
+            # Self first, then other users
+            self.users_list_model.set_users(self.username, list(self.connected_users))
     
     @Slot()
     def copy_session_info(self):
         """Copy session ID and server address to clipboard."""
         try:
-            from PySide6.QtGui import QGuiApplication
-            
             # Get port information if available
             tcp_port = "Unknown"
             udp_port = "Unknown"
-            if hasattr(self, 'media_manager') and self.media_manager:
+            if self.media_manager:
                 # Try to get port info from client
                 if hasattr(self.media_manager, 'client'):
                     tcp_port = getattr(self.media_manager.client, 'tcp_port', 'Unknown')
@@ -2013,7 +2298,7 @@ UDP Port: {udp_port}"""
     
     def _on_error_reported(self, error_report):
         """Handle error reports from the error manager."""
-        logger.debug(f"GUI received error report: {error_report.title}")
+        logger.debug("GUI received error report: %s", error_report.title)
         
         # Update button states if error affects media features
         if error_report.category == ErrorCategory.MEDIA:
@@ -2026,7 +2311,7 @@ UDP Port: {udp_port}"""
     
     def _on_error_resolved(self, error_id: str):
         """Handle error resolution."""
-        logger.debug(f"GUI received error resolution: {error_id}")
+        logger.debug("GUI received error resolution: %s", error_id)
         # Reset button states - this is a simplified approach
         # In production, you'd track which specific errors affect which buttons
         self._update_audio_button_error_state(False)
@@ -2035,88 +2320,15 @@ UDP Port: {udp_port}"""
     
     def _update_audio_button_error_state(self, has_error: bool):
         """Update audio button to reflect error state."""
-        if has_error:
-            self.audio_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #ffcdd2;
-                    color: #d32f2f;
-                    font-size: 14px;
-                    font-weight: bold;
-                    border: 2px solid #d32f2f;
-                }
-            """)
-        else:
-            # Reset to normal style
-            if self.audio_active:
-                self.audio_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #f44336;
-                        color: white;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                """)
-            else:
-                self.audio_btn.setStyleSheet("font-size: 14px; font-weight: bold;")
+        set_style_state(self.audio_btn, "error", has_error)
     
     def _update_video_button_error_state(self, has_error: bool):
         """Update video button to reflect error state."""
-        if has_error:
-            self.video_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #ffcdd2;
-                    color: #d32f2f;
-                    font-size: 14px;
-                    font-weight: bold;
-                    border: 2px solid #d32f2f;
-                }
-            """)
-        else:
-            # Reset to normal style
-            if self.video_active:
-                self.video_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #f44336;
-                        color: white;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                """)
-            else:
-                self.video_btn.setStyleSheet("font-size: 14px; font-weight: bold;")
+        set_style_state(self.video_btn, "error", has_error)
     
     def _update_screen_share_button_error_state(self, has_error: bool):
         """Update screen share button to reflect error state."""
-        if has_error:
-            self.screen_share_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #ffcdd2;
-                    color: #d32f2f;
-                    font-size: 14px;
-                    font-weight: bold;
-                    border: 2px solid #d32f2f;
-                }
-            """)
-        else:
-            # Reset to normal style
-            if self.screen_share_active:
-                self.screen_share_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #f44336;
-                        color: white;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                """)
-            else:
-                self.screen_share_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #FF9800;
-                        color: white;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                """)
+        set_style_state(self.screen_share_btn, "error", has_error)
     
     def set_connection_status(self, connected: bool):
         """Update connection status indicator."""
@@ -2150,16 +2362,9 @@ UDP Port: {udp_port}"""
     
     def show_success_notification(self, title: str, message: str):
         """Show a success notification."""
-        notification = NotificationWidget(title, message, "info", 3000)
-        notification.show_notification(self)
-        self.active_notifications.append(notification)
-        notification.closed.connect(lambda: self._remove_notification(notification))
-    
-    def _remove_notification(self, notification):
-        """Remove notification from active list."""
-        if notification in self.active_notifications:
-            self.active_notifications.remove(notification)
-        notification.deleteLater()
+        # Shares the status bar's pool and visible cap with error notifications
+        self.enhanced_status_bar.show_notification(title, message, "info", 3000, anchor=self)
+    
     # ========================================================================
     # Audio Strength Monitoring Methods
     # ========================================================================
@@ -2173,31 +2378,19 @@ UDP Port: {udp_port}"""
         """
         self.media_manager = media_manager
         if media_manager:
-            # Set up audio strength callback
-            media_manager.set_audio_strength_callback(self._on_audio_strength_update)
+            # Speaking state is polled from the media manager by the display timer
             logger.info("Audio strength monitoring connected to media manager")
     
-    def _on_audio_strength_update(self, current_strength: float, peak_strength: float):
-        """
-        Callback for audio strength updates from media manager.
-        
-        Args:
-            current_strength: Current audio strength (0.0 to 1.0)
-            peak_strength: Peak audio strength (0.0 to 1.0)
-        """
-        # Store values for display update
-        self.current_audio_strength = current_strength
-        self.peak_audio_strength = peak_strength
-    
     def _update_audio_strength_display(self):
         """Update the user grid based on speaking status."""
         try:
             # Check if user is speaking
             is_speaking = False
-            if hasattr(self, 'media_manager') and self.media_manager:
+            if self.media_manager:
                 is_speaking = self.media_manager.is_user_speaking()
             
-            # Update self speaking state in grid (visual only - no grid refresh needed)
+            # Update self speaking state in grid (visual only - no grid refresh needed);
+            # the box itself ignores ticks that don't change the state
             if self.username in self.user_boxes:
                 self.user_boxes[self.username].update_speaking_state(is_speaking)
             
@@ -2209,7 +2402,7 @@ UDP Port: {udp_port}"""
     
     def reset_peak_audio_strength(self):
         """Reset the peak audio strength measurement."""
-        if hasattr(self, 'media_manager') and self.media_manager:
+        if self.media_manager:
             self.media_manager.reset_peak_audio_strength()
             logger.info("Peak audio strength reset")
 
@@ -2219,22 +2412,7 @@ UDP Port: {udp_port}"""
     
     def _calculate_optimal_grid(self, user_count: int) -> tuple:
         """Calculate optimal grid dimensions based on user count."""
-        if user_count == 0:
-            return (1, 1)
-        elif user_count == 1:
-            return (1, 1)  # Single user takes full space
-        elif user_count == 2:
-            return (1, 2)  # Two users side by side
-        elif user_count <= 4:
-            return (2, 2)  # 2x2 grid for 3-4 users
-        elif user_count <= 6:
-            return (2, 3)  # 2x3 grid for 5-6 users
-        elif user_count <= 9:
-            return (3, 3)  # 3x3 grid for 7-9 users
-        elif user_count <= 12:
-            return (3, 4)  # 3x4 grid for 10-12 users
-        else:
-            return (4, 4)  # 4x4 grid for more users
+        return GRID_DIMENSIONS[min(user_count, len(GRID_DIMENSIONS) - 1)]
     
     def _create_dynamic_grid(self):
         """Create dynamic grid layout based on current user count."""
@@ -2245,11 +2423,8 @@ UDP Port: {udp_port}"""
         self._grid_updating = True
         
         try:
-            # Clear existing layout
-            for i in reversed(range(self.content_layout.count())):
-                widget = self.content_layout.itemAt(i).widget()
-                if widget:
-                    widget.setParent(None)
+            # Tile sizes are about to change; decode workers re-read them on the next frame
+            self._video_target_sizes.clear()
             
             # Get all users (always show all users in session)
             all_users = []
@@ -2262,36 +2437,33 @@ UDP Port: {udp_port}"""
             
             user_count = len(all_users)
             
+            # Work out where every widget should go first, then only touch the ones that move
+            placements = {}  # widget -> (row, col)
+            
             if user_count == 0:
                 # Show welcome message when no users and no active media
                 welcome_label = QLabel("🎉 Welcome to LAN Communicator!\n\nClick the video or audio button below to start.\nYou'll see yourself here, and others will appear as they join.")
                 welcome_label.setAlignment(Qt.AlignCenter)
-                welcome_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 18px;
-                        color: #666;
-                        padding: 40px;
-                        background-color: #f8f9fa;
-                        border: 2px dashed #ddd;
-                        border-radius: 15px;
-                    }
-                """)
-                self.content_layout.addWidget(welcome_label, 0, 0)
-                return
+                welcome_label.setObjectName("WelcomeLabel")
+                placements[welcome_label] = (0, 0)
             
             # Calculate optimal grid dimensions for users and presentations
             total_items = user_count + len(self.presentation_boxes)
             rows, cols = self._calculate_optimal_grid(total_items)
             
+            # Every box of a kind gets the same size, so work it out once per rebuild
+            user_box_size = self._grid_box_size(rows, cols, total_items, (200, 150), (700, 500))
+            # Presentations get a larger minimum size than user boxes
+            presentation_box_size = self._grid_box_size(rows, cols, total_items, (300, 200), (900, 600))
+            
             current_position = 0
+            visible_users = set()
             
             # Add users to grid first
             for i, username in enumerate(all_users):
                 if current_position >= rows * cols:
                     break  # Don't exceed grid capacity
-                
-                row = current_position // cols
-                col = current_position % cols
+                visible_users.add(username)
                 
                 # Create or get user box
                 if username not in self.user_boxes:
@@ -2301,9 +2473,9 @@ UDP Port: {udp_port}"""
                 user_box = self.user_boxes[username]
                 
                 # Set dynamic size based on grid dimensions and available space
-                self._resize_user_box(user_box, rows, cols, total_items)
+                user_box.update_size(*user_box_size)
                 
-                self.content_layout.addWidget(user_box, row, col)
+                placements[user_box] = divmod(current_position, cols)
                 current_position += 1
             
             # Add presentation boxes
@@ -2311,20 +2483,45 @@ UDP Port: {udp_port}"""
                 if current_position >= rows * cols:
                     break  # Don't exceed grid capacity
                 
-                row = current_position // cols
-                col = current_position % cols
-                
                 # Set dynamic size for presentation box
-                self._resize_presentation_box(presentation_box, rows, cols, total_items)
+                presentation_box.update_size(*presentation_box_size)
                 
-                self.content_layout.addWidget(presentation_box, row, col)
+                placements[presentation_box] = divmod(current_position, cols)
                 current_position += 1
             
-            # Set grid layout properties for optimal spacing
-            for i in range(rows):
-                self.content_layout.setRowStretch(i, 1)
-            for j in range(cols):
-                self.content_layout.setColumnStretch(j, 1)
+            self._visible_users = visible_users
+            
+            self.content_area.setUpdatesEnabled(False)
+            try:
+                # Take out widgets that are no longer shown (departed users, closed presentations, overflow)
+                for widget in self._grid_positions:
+                    if widget not in placements:
+                        self.content_layout.removeWidget(widget)
+                        widget.setParent(None)
+                
+                # Place new widgets and move the ones whose cell changed; the rest stay where they are
+                for widget, (row, col) in placements.items():
+                    if self._grid_positions.get(widget) == (row, col) and self.content_layout.indexOf(widget) != -1:
+                        continue
+                    self.content_layout.removeWidget(widget)
+                    self.content_layout.addWidget(widget, row, col)
+                self._grid_positions = placements
+                
+                # Set grid layout properties for optimal spacing (equal stretch); each call
+                # invalidates the layout, so only touch them when the grid shape changes
+                if self._grid_stretch != (rows, cols):
+                    old_rows, old_cols = self._grid_stretch
+                    for i in range(rows, old_rows):
+                        self.content_layout.setRowStretch(i, 0)
+                    for j in range(cols, old_cols):
+                        self.content_layout.setColumnStretch(j, 0)
+                    for i in range(old_rows, rows):
+                        self.content_layout.setRowStretch(i, 1)
+                    for j in range(old_cols, cols):
+                        self.content_layout.setColumnStretch(j, 1)
+                    self._grid_stretch = (rows, cols)
+            finally:
+                self.content_area.setUpdatesEnabled(True)
                 
         finally:
             # Always reset the flag to allow future updates
@@ -2333,77 +2530,77 @@ UDP Port: {udp_port}"""
     def _delayed_grid_update(self):
         """Delayed grid update to prevent rapid successive updates."""
         if not self._grid_updating:
+            if self._grid_dirty:
+                self._grid_dirty = False
+                self._sync_grid_with_users()
             self._create_dynamic_grid()
     
-    def _schedule_grid_update(self):
-        """Schedule a debounced grid update."""
-        # Stop any existing timer and start a new one
-        self._grid_update_timer.stop()
-        self._grid_update_timer.start(50)  # 50ms debounce delay
-    
-    def _resize_user_box(self, user_box: UserBox, rows: int, cols: int, total_items: int):
-        """Dynamically resize user box based on grid layout."""
-        # Get the actual available space from the content area
-        content_widget = self.content_area
-        available_width = content_widget.width() if content_widget.width() > 0 else 800
-        available_height = content_widget.height() if content_widget.height() > 0 else 600
-        
-        # Account for margins and spacing
-        margin = 20
-        spacing = 10
-        
-        # Calculate size per box
-        box_width = (available_width - margin - (cols - 1) * spacing) // cols
-        box_height = (available_height - margin - (rows - 1) * spacing) // rows
+    def _sync_grid_with_users(self):
+        """Reconcile grid order, user boxes and the users sidebar with connected_users."""
+        # Drop users that have left
+        for username in [u for u in self.user_order if u not in self.connected_users]:
+            del self.user_order[username]
+            if username in self.user_boxes:
+                user_box = self.user_boxes.pop(username)
+                user_box.setParent(None)
         
-        # Ensure minimum readable size
-        box_width = max(box_width, 200)
-        box_height = max(box_height, 150)
+        # Append users that have joined (new users go to the end)
+        for username in self.connected_users:
+            if username != self.username and username not in self.user_order:
+                self.user_order[username] = None
         
-        # For single item, make it larger and more cinematic
-        if total_items == 1:
-            box_width = min(available_width - margin, 700)
-            box_height = min(available_height - margin, 500)
-        
-        # Use the new update_size method
-        user_box.update_size(box_width, box_height)
+        # Update users sidebar if it exists
+        if hasattr(self, 'users_list_widget'):
+            self.update_users_list()
     
-    def _resize_presentation_box(self, presentation_box: PresentationBox, rows: int, cols: int, total_items: int):
-        """Dynamically resize presentation box based on grid layout."""
+    def _schedule_grid_update(self):
+        """Schedule a coalesced grid update."""
+        # Requests arriving while one is pending fold into it; the timer is not restarted,
+        # so a steady stream of joins or resize events can't postpone the rebuild forever
+        if not self._grid_update_timer.isActive():
+            self._grid_update_timer.start(GRID_UPDATE_DELAY_MS)
+    
+    def _grid_box_size(self, rows: int, cols: int, total_items: int, min_size: tuple, single_max: tuple) -> tuple:
+        """Calculate the (width, height) of one grid box from the content area size."""
         # Get the actual available space from the content area
         content_widget = self.content_area
         available_width = content_widget.width() if content_widget.width() > 0 else 800
         available_height = content_widget.height() if content_widget.height() > 0 else 600
         
-        # Account for margins and spacing
-        margin = 20
-        spacing = 10
+        # Account for the grid's own margins and spacing so the boxes never outgrow the content area
+        margins = self.content_layout.contentsMargins()
+        margin_x = margins.left() + margins.right()
+        margin_y = margins.top() + margins.bottom()
         
-        # Calculate size per box
-        box_width = (available_width - margin - (cols - 1) * spacing) // cols
-        box_height = (available_height - margin - (rows - 1) * spacing) // rows
-        
-        # Ensure minimum readable size for presentations (larger than user boxes)
-        box_width = max(box_width, 300)
-        box_height = max(box_height, 200)
-        
-        # For single item, make it larger
+        return self._compute_box_size(rows, cols, total_items, min_size, single_max,
+                                      available_width - margin_x, available_height - margin_y,
+                                      self.content_layout.spacing())
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _compute_box_size(rows: int, cols: int, total_items: int, min_size: tuple, single_max: tuple,
+                          inner_width: int, inner_height: int, spacing: int) -> tuple:
+        """Size one grid box inside the margins; pure, so repeated grid shapes and sizes hit the cache."""
+        # For single item, make it larger and more cinematic
         if total_items == 1:
-            box_width = min(available_width - margin, 900)
-            box_height = min(available_height - margin, 600)
+            return min(inner_width, single_max[0]), min(inner_height, single_max[1])
         
-        presentation_box.update_size(box_width, box_height)
+        # Calculate size per box, keeping a minimum readable size
+        box_width = (inner_width - (cols - 1) * spacing) // cols
+        box_height = (inner_height - (rows - 1) * spacing) // rows
+        return max(box_width, min_size[0]), max(box_height, min_size[1])
     
     def add_user_to_grid(self, username: str, user_info: dict = None):
         """Add a user to the dynamic grid system."""
         if username == self.username:
-            # Self is handled automatically in _create_dynamic_grid based on media state
-            self._schedule_grid_update()
+            # Self is always placed by _create_dynamic_grid; only a missing box needs a rebuild
+            if username not in self.user_boxes:
+                self._schedule_grid_update()
             return
         
         if username not in self.user_order:
             # Add to user order (new users go to the end)
-            self.user_order.append(username)
+            self.user_order[username] = None
             
             # Schedule grid update with debouncing
             self._schedule_grid_update()
@@ -2412,14 +2609,22 @@ UDP Port: {udp_port}"""
     
     def remove_user_from_grid(self, username: str):
         """Remove a user from the dynamic grid system."""
+        changed = False
+        
         # Remove from user order
         if username in self.user_order:
-            self.user_order.remove(username)
+            del self.user_order[username]
+            changed = True
         
         # Remove widget if it exists
         if username in self.user_boxes:
             user_box = self.user_boxes.pop(username)
             user_box.setParent(None)
+            changed = True
+        
+        # Repeated removals of a user who is already gone cost nothing
+        if not changed:
+            return
         
         # Schedule grid update with debouncing
         self._schedule_grid_update()
@@ -2435,6 +2640,9 @@ UDP Port: {udp_port}"""
     
     def remove_presentation_box(self, username: str):
         """Remove a presentation box."""
+        with self._frame_lock:
+            self._pending_screens.pop(username, None)
+        self._screen_signals.discard(username)
         if username in self.presentation_boxes:
             presentation_box = self.presentation_boxes.pop(username)
             presentation_box.setParent(None)
@@ -2443,42 +2651,36 @@ UDP Port: {udp_port}"""
     
     def _update_page_navigation(self):
         """Update page navigation visibility and state."""
-        total_users = len(self.user_order)
-        if self.audio_active or self.video_active:
-            total_users += 1  # Include self when media is active
-        
         # For now, disable pagination since we're using dynamic grid
         # In the future, this could be used for very large groups (>16 users)
-        if hasattr(self, 'prev_page_btn'):
-            self.prev_page_btn.setVisible(False)
-        if hasattr(self, 'next_page_btn'):
-            self.next_page_btn.setVisible(False)
-        if hasattr(self, 'page_label'):
-            self.page_label.setVisible(False)
+        for widget in (self.prev_page_btn, self.next_page_btn, self.page_label):
+            if widget is not None and widget.isVisible():
+                widget.setVisible(False)
     
     def update_user_speaking_state(self, username: str, is_speaking: bool):
         """Update speaking state for a user."""
-        logger.info(f"🗣️ GUI: update_user_speaking_state called for {username}, speaking={is_speaking}")
+        logger.debug("🗣️ GUI: update_user_speaking_state called for %s, speaking=%s", username, is_speaking)
         if username in self.user_boxes:
             user_box = self.user_boxes[username]
-            logger.info(f"🗣️ GUI: Found user box for {username}, updating speaking state")
+            if user_box.is_speaking == is_speaking:
+                return
+            logger.debug("🗣️ GUI: Found user box for %s, updating speaking state", username)
             user_box.update_speaking_state(is_speaking)
         else:
-            logger.warning(f"🗣️ GUI: No user box found for {username} in update_user_speaking_state")
+            # Off-page speakers land here on every loud audio packet, so keep it at debug
+            logger.debug("🗣️ GUI: No user box found for %s in update_user_speaking_state", username)
             
             # Only move speaking user to front for large groups (>9 users)
             # For small groups, avoid unnecessary grid refreshes
-            total_users = len(self.user_order) + (1 if self.audio_active or self.video_active else 0)
-            if is_speaking and total_users > 9 and username not in self._get_current_page_users():
+            # (the grid's placed users are kept as a set, so this is a single lookup)
+            if is_speaking and self._get_total_users() > 9 and username not in self._visible_users:
                 self._move_user_to_front(username)
     
     def _move_user_to_front(self, username: str):
         """Move a speaking user to the front of the grid."""
         if username in self.user_order:
-            # Remove from current position
-            self.user_order.remove(username)
-            # Add to front
-            self.user_order.insert(0, username)
+            # Move to the front in place
+            self.user_order.move_to_end(username, last=False)
             
             # Go to first page to show the speaking user
             self.current_page = 0
@@ -2486,35 +2688,23 @@ UDP Port: {udp_port}"""
             
             logger.info(f"Moved speaking user '{username}' to front")
     
+    def _get_total_users(self) -> int:
+        """Count the tiles in the grid: every other user, plus self when media is active."""
+        return len(self.user_order) + (1 if self.audio_active or self.video_active else 0)
+    
     def _get_current_page_users(self) -> list:
         """Get list of users on current page."""
         start_idx = self.current_page * self.users_per_page
         end_idx = start_idx + self.users_per_page
-        return self.user_order[start_idx:end_idx]
+        return list(islice(self.user_order, start_idx, end_idx))
     
     def _refresh_grid(self):
         """Refresh the dynamic grid display."""
-        # Simply recreate the dynamic grid
-        self._create_dynamic_grid()
+        # Goes through the coalesced update like every other grid change
+        self._schedule_grid_update()
         
         # Update page navigation (if still needed for very large groups)
         self._update_page_navigation()
-        self._update_page_navigation()
-    
-    def _update_page_navigation(self):
-        """Update page navigation buttons and label."""
-        total_users = len(self.user_order)
-        if self.audio_active:
-            total_users += 1  # Include self
-        
-        total_pages = max(1, (total_users + self.users_per_page - 1) // self.users_per_page)
-        
-        # Update label
-        self.page_label.setText(f"Page {self.current_page + 1} of {total_pages}")
-        
-        # Update button states
-        self.prev_page_btn.setEnabled(self.current_page > 0)
-        self.next_page_btn.setEnabled(self.current_page < total_pages - 1)
     
     def previous_page(self):
         """Go to previous page."""
@@ -2524,10 +2714,7 @@ UDP Port: {udp_port}"""
     
     def next_page(self):
         """Go to next page."""
-        total_users = len(self.user_order)
-        if self.audio_active:
-            total_users += 1
-        total_pages = max(1, (total_users + self.users_per_page - 1) // self.users_per_page)
+        total_pages = max(1, (self._get_total_users() + self.users_per_page - 1) // self.users_per_page)
         
         if self.current_page < total_pages - 1:
             self.current_page += 1
@@ -2538,19 +2725,55 @@ UDP Port: {udp_port}"""
     
     def update_user_video_frame(self, username: str, frame_data: bytes):
         """Update video frame for a specific user."""
-        logger.info(f"🎬 GUI: update_user_video_frame called for {username}, {len(frame_data)} bytes")
-        if username in self.user_boxes:
-            logger.info(f"🎬 GUI: Found user box for {username}, calling set_video_frame")
-            self.user_boxes[username].set_video_frame(frame_data)
-        else:
-            logger.warning(f"No user box found for {username}")
-            # Try to create the user box if it doesn't exist
-            if username == self.username and (self.audio_active or self.video_active):
-                logger.info(f"Creating user box for self ({username}) since media is active")
-                self._create_dynamic_grid()
+        logger.debug("🎬 GUI: update_user_video_frame called for %s, %d bytes", username, len(frame_data))
+        
+        # Users beyond the grid's capacity have no tile on screen; don't decode their video.
+        # Their hash isn't recorded, so the first frame after they are placed is decoded.
+        if username not in self._visible_users:
+            return
+        
+        # Static content (paused webcam, slides) repeats byte-identical frames
+        h = frame_hash(frame_data)
+        if self._last_frame_hash.get(username) == h:
+            user_box = self.user_boxes.get(username)
+            if user_box and not user_box.has_video and username in self._last_frame_pixmap:
+                # Box was rebuilt since the frame was shown; repaint it without decoding or converting
+                self._show_user_pixmap(username, self._last_frame_pixmap[username])
+            return
+        self._last_frame_hash[username] = h
+        
+        with self._frame_lock:
+            # Only the newest undecoded frame is kept; older ones are dropped
+            self._pending_frames[username] = (frame_data, self._video_target_size(username))
+            if username in self._decoding:
+                return
+            self._decoding.add(username)
+        
+        # Decode on the thread pool; the result comes back through _display_user_video
+        self._decode_pool.start(FrameDecodeRunnable(self._frame_signals, username, self._take_pending_frame))
+    
+    def _take_pending_frame(self, username: str):
+        """Pop the newest pending (frame_data, target_size) for a user (called from decode workers)."""
+        with self._frame_lock:
+            pending = self._pending_frames.pop(username, None)
+            if pending is None:
+                self._decoding.discard(username)
+            return pending
+    
+    def _video_target_size(self, username: str):
+        """Get the cached (width, height) a user's video is displayed at, or None if unknown."""
+        target_size = self._video_target_sizes.get(username)
+        if target_size is None and username in self.user_boxes:
+            size = self.user_boxes[username].video_area.size()
+            if size.width() > 0 and size.height() > 0:
+                target_size = (size.width(), size.height())
+                self._video_target_sizes[username] = target_size
+        return target_size
     
     def clear_user_video(self, username: str):
         """Clear video for a specific user (return to initials)."""
+        self._last_frame_hash.pop(username, None)
+        self._last_frame_pixmap.pop(username, None)
         if username in self.user_boxes:
             self.user_boxes[username].clear_video()
     
@@ -2562,45 +2785,44 @@ UDP Port: {udp_port}"""
     
     def update_video_frame(self, username: str, video_data: bytes):
         """Handle received video frame (called from app.py)."""
-        logger.info(f"🎬 GUI: update_video_frame called for {username}, {len(video_data)} bytes")
+        logger.debug("🎬 GUI: update_video_frame called for %s, %d bytes", username, len(video_data))
         self.update_user_video_frame(username, video_data)
     
     def update_user_audio_state(self, username: str, is_speaking: bool):
         """Update audio speaking state for a user."""
         if username in self.user_boxes:
             self.user_boxes[username].update_speaking_state(is_speaking)
-            logger.debug(f"Updated speaking state for {username}: {is_speaking}")
+            logger.debug("Updated speaking state for %s: %s", username, is_speaking)
     
     def handle_audio_data_received(self, username: str, audio_data: bytes):
         """Handle received audio data and detect speaking."""
-        logger.info(f"🎵 GUI: handle_audio_data_received called for {username}, {len(audio_data)} bytes")
-        # For now, we'll assume any audio data means the user is speaking
-        # In a more sophisticated implementation, we would analyze the audio level
+        logger.debug("🎵 GUI: handle_audio_data_received called for %s, %d bytes", username, len(audio_data))
+        # RMS level of the 16-bit packet, computed vectorised; silent packets change nothing
+        # and the speaking state falls back to False once the timer below runs out
+        samples = np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2)
+        if not samples.size:
+            return
+        level = samples.astype(np.float32)
+        rms = float(np.sqrt(np.dot(level, level) / level.size)) / 32767.0
+        if rms <= SPEAKING_RMS_THRESHOLD:
+            return
+        
+        self.update_user_speaking_state(username, True)
         if username in self.user_boxes:
-            # Simple speaking detection: if we receive audio data, user is speaking
-            # This will be updated when we receive the next audio packet or after a timeout
-            self.user_boxes[username].update_speaking_state(True)
-            
-            # Set a timer to reset speaking state after a short delay
-            if not hasattr(self, 'speaking_timers'):
-                self.speaking_timers = {}
-            
-            # Cancel existing timer for this user
-            if username in self.speaking_timers:
-                self.speaking_timers[username].stop()
-            
-            # Create new timer to reset speaking state
-            timer = QTimer()
-            timer.setSingleShot(True)
-            timer.timeout.connect(lambda: self._reset_speaking_state(username))
+            # One timer per user, restarted by every packet; created on the first packet only
+            timer = self.speaking_timers.get(username)
+            if timer is None:
+                timer = QTimer(self)
+                timer.setSingleShot(True)
+                timer.timeout.connect(partial(self._reset_speaking_state, username))
+                self.speaking_timers[username] = timer
             timer.start(500)  # Reset after 500ms of no audio
-            self.speaking_timers[username] = timer
     
     def _reset_speaking_state(self, username: str):
         """Reset speaking state for a user."""
         if username in self.user_boxes:
             self.user_boxes[username].update_speaking_state(False)
-            logger.debug(f"Reset speaking state for {username}")
+            logger.debug("Reset speaking state for %s", username)
     
     def update_user_media_state(self, username: str, media_type: str, is_active: bool):
         """Update media state for a remote user."""
@@ -2616,6 +2838,9 @@ UDP Port: {udp_port}"""
         else:
             logger.warning(f"🎭 GUI: No user box found for {username} in update_user_media_state")
         
-        # Clean up timer
-        if hasattr(self, 'speaking_timers') and username in self.speaking_timers:
-            del self.speaking_timers[username]
\ No newline at end of file
+        # Clean up timer; the pending reset will never fire, so clear the highlight now
+        if username in self.speaking_timers:
+            timer = self.speaking_timers.pop(username)
+            timer.stop()
+            timer.deleteLater()
+            self._reset_speaking_state(username)
\ No newline at end of file
@@ -7,18 +7,137 @@ Implements non-blocking notifications and real-time status updates.
 
 from PySide6.QtWidgets import (
     QWidget, QLabel, QHBoxLayout, QVBoxLayout, QPushButton,
-    QProgressBar, QFrame, QScrollArea, QListWidget, QListWidgetItem,
+    QProgressBar, QFrame, QScrollArea, QListView,
     QDialog, QTextEdit, QGroupBox, QGridLayout, QSystemTrayIcon,
     QMenu, QApplication
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QPropertyAnimation, QEasingCurve, QRect
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QPropertyAnimation, QEasingCurve, QRect,
+    QAbstractListModel, QModelIndex
+)
 from PySide6.QtGui import QPixmap, QPainter, QColor, QFont, QIcon
 from utils.error_manager import ErrorManager, ErrorReport, ErrorSeverity, ErrorCategory
 from utils.logger import setup_logger
 import time
+from collections import deque
+from functools import lru_cache
 
 logger = setup_logger(__name__)
 
+# Status color mapping
+STATUS_COLORS = {
+    'connected': '#4CAF50',      # Green
+    'connecting': '#FF9800',     # Orange
+    'disconnected': '#f44336',   # Red
+    'reconnecting': '#2196F3',   # Blue
+    'active': '#4CAF50',         # Green
+    'inactive': '#9E9E9E',       # Gray
+    'error': '#f44336',          # Red
+    'warning': '#FF9800',        # Orange
+    'idle': '#9E9E9E',           # Gray
+    'processing': '#2196F3',     # Blue
+    'unknown': '#9E9E9E'         # Gray
+}
+
+# Status icons
+STATUS_ICONS = {
+    'connected': '●',
+    'connecting': '◐',
+    'disconnected': '○',
+    'reconnecting': '◑',
+    'active': '●',
+    'inactive': '○',
+    'error': '✗',
+    'warning': '⚠',
+    'idle': '○',
+    'processing': '◐',
+    'unknown': '?'
+}
+
+STATUS_STYLE_TEMPLATE = """
+    QLabel {{
+        border: 1px solid {color};
+        border-radius: 12px;
+        padding: 4px 8px;
+        font-size: 11px;
+        font-weight: bold;
+        background-color: {color}20;
+        color: {color};
+    }}
+"""
+
+# (icon, stylesheet) per status, built once so a status change is one lookup and no CSS formatting
+STATUS_DISPLAY = {
+    status: (STATUS_ICONS.get(status, '?'), STATUS_STYLE_TEMPLATE.format(color=color))
+    for status, color in STATUS_COLORS.items()
+}
+
+# Notification icon and (background, border) colors per severity
+NOTIFICATION_ICONS = {
+    'info': '💬',
+    'warning': '⚠️',
+    'error': '❌',
+    'critical': '🚨'
+}
+
+NOTIFICATION_COLORS = {
+    'info': ('#E3F2FD', '#2196F3'),
+    'warning': ('#FFF3E0', '#FF9800'),
+    'error': ('#FFEBEE', '#f44336'),
+    'critical': ('#FCE4EC', '#E91E63')
+}
+
+NOTIFICATION_STYLE_TEMPLATE = """
+    QWidget {{
+        background-color: {bg_color};
+        border: 2px solid {border_color};
+        border-radius: 8px;
+    }}
+"""
+
+NOTIFICATION_STYLES = {
+    severity: NOTIFICATION_STYLE_TEMPLATE.format(bg_color=bg_color, border_color=border_color)
+    for severity, (bg_color, border_color) in NOTIFICATION_COLORS.items()
+}
+
+# Row backgrounds for active errors in the error details dialog
+ERROR_SEVERITY_BACKGROUNDS = {
+    ErrorSeverity.CRITICAL: QColor("#FFEBEE"),
+    ErrorSeverity.ERROR: QColor("#FFF3E0"),
+    ErrorSeverity.WARNING: QColor("#FFF8E1")
+}
+
+# Error summary label styles, keyed by the highest severity present
+SUMMARY_STYLE_TEMPLATE = """
+    QLabel {{
+        color: {color};
+        font-size: 10px;
+        font-weight: bold;
+        padding: 2px 6px;
+        border-radius: 3px;
+        background-color: {bg_color};
+        border: 1px solid {color};
+    }}
+"""
+
+SUMMARY_STYLES = {
+    'ok': """
+    QLabel {
+        color: #666;
+        font-size: 10px;
+        padding: 2px 6px;
+        border-radius: 3px;
+        background-color: #f0f0f0;
+    }
+""",
+    'critical': SUMMARY_STYLE_TEMPLATE.format(color="#f44336", bg_color="#FFEBEE"),  # Red
+    'error': SUMMARY_STYLE_TEMPLATE.format(color="#FF5722", bg_color="#FFF3E0"),  # Deep Orange
+    'warning': SUMMARY_STYLE_TEMPLATE.format(color="#FF9800", bg_color="#FFF8E1")  # Orange
+}
+
+# Notifications kept on screen at once; also bounds the widget pool
+MAX_ACTIVE_NOTIFICATIONS = 3
+
 class StatusIndicator(QLabel):
     """
     Enhanced status indicator with color coding and animations.
@@ -27,8 +146,9 @@ class StatusIndicator(QLabel):
     def __init__(self, component_name: str, parent=None):
         super().__init__(parent)
         self.component_name = component_name
-        self.current_status = "unknown"
-        self.current_message = "Status unknown"
+        self.display_name = component_name.title()
+        self.current_status = None  # nothing shown yet; set by the update_status call below
+        self.current_message = None
         
         # Setup appearance
         self.setMinimumSize(120, 24)
@@ -47,71 +167,46 @@ class StatusIndicator(QLabel):
         self.animation = QPropertyAnimation(self, b"geometry")
         self.animation.setDuration(200)
         self.animation.setEasingCurve(QEasingCurve.OutCubic)
+        self.animation.finished.connect(self._on_animation_finished)
+        self._anim_phase = None  # "expand" or "restore" while the pulse runs
+        self._anim_rect = None  # geometry to return to after the pulse
         
         self.update_status("unknown", "Status unknown")
     
     def update_status(self, status: str, message: str = None):
         """Update the status indicator."""
+        message = message or status
+        if status == self.current_status and message == self.current_message:
+            return  # Repeated report; nothing to restyle or animate
+        
+        status_changed = status != self.current_status
         self.current_status = status
-        self.current_message = message or status
-        
-        # Status color mapping
-        status_colors = {
-            'connected': '#4CAF50',      # Green
-            'connecting': '#FF9800',     # Orange
-            'disconnected': '#f44336',   # Red
-            'reconnecting': '#2196F3',   # Blue
-            'active': '#4CAF50',         # Green
-            'inactive': '#9E9E9E',       # Gray
-            'error': '#f44336',          # Red
-            'warning': '#FF9800',        # Orange
-            'idle': '#9E9E9E',           # Gray
-            'processing': '#2196F3',     # Blue
-            'unknown': '#9E9E9E'         # Gray
-        }
-        
-        # Status icons
-        status_icons = {
-            'connected': '●',
-            'connecting': '◐',
-            'disconnected': '○',
-            'reconnecting': '◑',
-            'active': '●',
-            'inactive': '○',
-            'error': '✗',
-            'warning': '⚠',
-            'idle': '○',
-            'processing': '◐',
-            'unknown': '?'
-        }
-        
-        color = status_colors.get(status, '#9E9E9E')
-        icon = status_icons.get(status, '?')
-        
-        # Update text and style
-        display_text = f"{icon} {self.component_name.title()}"
-        self.setText(display_text)
-        self.setToolTip(f"{self.component_name.title()}: {self.current_message}")
-        
-        self.setStyleSheet(f"""
-            QLabel {{
-                border: 1px solid {color};
-                border-radius: 12px;
-                padding: 4px 8px;
-                font-size: 11px;
-                font-weight: bold;
-                background-color: {color}20;
-                color: {color};
-            }}
-        """)
+        self.current_message = message
+        
+        # Tooltip carries the message; text and style only depend on the status
+        self.setToolTip(f"{self.display_name}: {message}")
+        if not status_changed:
+            return
+        
+        icon, style = STATUS_DISPLAY.get(status, STATUS_DISPLAY['unknown'])
+        self.setText(f"{icon} {self.display_name}")
+        self.setStyleSheet(style)
         
         # Animate on status change
         self._animate_update()
     
     def _animate_update(self):
         """Animate status update."""
+        # Nobody sees the pulse of a hidden indicator
+        if not self.isVisible():
+            return
+        
+        # A pulse already in flight keeps its original geometry instead of growing from the expanded one
+        if self._anim_phase is None:
+            self._anim_rect = self.geometry()
+        original_rect = self._anim_rect
+        
         # Simple scale animation
-        original_rect = self.geometry()
         expanded_rect = QRect(
             original_rect.x() - 2,
             original_rect.y() - 1,
@@ -119,21 +214,28 @@ class StatusIndicator(QLabel):
             original_rect.height() + 2
         )
         
-        self.animation.setStartValue(original_rect)
+        self.animation.stop()
+        self._anim_phase = "expand"
+        self.animation.setStartValue(self.geometry())
         self.animation.setEndValue(expanded_rect)
-        self.animation.finished.connect(lambda: self._reset_animation(original_rect))
         self.animation.start()
     
-    def _reset_animation(self, original_rect):
-        """Reset animation to original size."""
-        self.animation.setStartValue(self.geometry())
-        self.animation.setEndValue(original_rect)
-        self.animation.finished.disconnect()
-        self.animation.start()
+    def _on_animation_finished(self):
+        """Shrink back after the expand step, and finish after the restore step."""
+        if self._anim_phase == "expand":
+            self._anim_phase = "restore"
+            self.animation.setStartValue(self.geometry())
+            self.animation.setEndValue(self._anim_rect)
+            self.animation.start()
+        else:
+            self._anim_phase = None
 
 class NotificationWidget(QWidget):
     """
     Non-blocking notification widget that slides in from the top.
+    
+    Instances can be re-skinned with set_content() and shown again, so
+    callers may keep a small pool instead of building one per event.
     """
     
     closed = Signal()
@@ -142,7 +244,8 @@ class NotificationWidget(QWidget):
                  duration: int = 5000, parent=None):
         super().__init__(parent)
         self.duration = duration
-        self.severity = severity
+        self.severity = None
+        self._closing = False
         
         # Setup widget
         self.setFixedHeight(80)
@@ -154,32 +257,23 @@ class NotificationWidget(QWidget):
         layout.setContentsMargins(10, 10, 10, 10)
         
         # Icon based on severity
-        icon_label = QLabel()
-        icon_label.setFixedSize(32, 32)
-        icon_label.setAlignment(Qt.AlignCenter)
-        
-        severity_icons = {
-            'info': '💬',
-            'warning': '⚠️',
-            'error': '❌',
-            'critical': '🚨'
-        }
-        
-        icon_label.setText(severity_icons.get(severity, '💬'))
-        icon_label.setStyleSheet("font-size: 20px;")
-        layout.addWidget(icon_label)
+        self.icon_label = QLabel()
+        self.icon_label.setFixedSize(32, 32)
+        self.icon_label.setAlignment(Qt.AlignCenter)
+        self.icon_label.setStyleSheet("font-size: 20px;")
+        layout.addWidget(self.icon_label)
         
         # Text content
         text_layout = QVBoxLayout()
         
-        title_label = QLabel(title)
-        title_label.setStyleSheet("font-weight: bold; font-size: 12px;")
-        text_layout.addWidget(title_label)
+        self.title_label = QLabel()
+        self.title_label.setStyleSheet("font-weight: bold; font-size: 12px;")
+        text_layout.addWidget(self.title_label)
         
-        message_label = QLabel(message)
-        message_label.setWordWrap(True)
-        message_label.setStyleSheet("font-size: 11px; color: #666;")
-        text_layout.addWidget(message_label)
+        self.message_label = QLabel()
+        self.message_label.setWordWrap(True)
+        self.message_label.setStyleSheet("font-size: 11px; color: #666;")
+        text_layout.addWidget(self.message_label)
         
         layout.addLayout(text_layout, 1)
         
@@ -203,40 +297,32 @@ class NotificationWidget(QWidget):
         close_btn.clicked.connect(self.close_notification)
         layout.addWidget(close_btn)
         
-        # Styling based on severity
-        severity_colors = {
-            'info': '#E3F2FD',
-            'warning': '#FFF3E0',
-            'error': '#FFEBEE',
-            'critical': '#FCE4EC'
-        }
-        
-        border_colors = {
-            'info': '#2196F3',
-            'warning': '#FF9800',
-            'error': '#f44336',
-            'critical': '#E91E63'
-        }
-        
-        bg_color = severity_colors.get(severity, '#E3F2FD')
-        border_color = border_colors.get(severity, '#2196F3')
-        
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {bg_color};
-                border: 2px solid {border_color};
-                border-radius: 8px;
-            }}
-        """)
+        # Auto-close timer, restarted on every show so a reused widget never
+        # inherits the countdown of its previous notification
+        self.close_timer = QTimer(self)
+        self.close_timer.setSingleShot(True)
+        self.close_timer.timeout.connect(self.close_notification)
         
-        # Auto-close timer
-        if duration > 0:
-            QTimer.singleShot(duration, self.close_notification)
-        
-        # Slide-in animation
+        # Slide animation, shared by slide-in and slide-out
         self.slide_animation = QPropertyAnimation(self, b"pos")
         self.slide_animation.setDuration(300)
         self.slide_animation.setEasingCurve(QEasingCurve.OutCubic)
+        self.slide_animation.finished.connect(self._on_slide_finished)
+        
+        self.set_content(title, message, severity, duration)
+    
+    def set_content(self, title: str, message: str, severity: str = "info", 
+                    duration: int = 5000):
+        """Replace the notification's text, severity and duration in place."""
+        self.title_label.setText(title)
+        self.message_label.setText(message)
+        self.duration = duration
+        
+        # Restyle only when the severity actually changes
+        if severity != self.severity:
+            self.severity = severity
+            self.icon_label.setText(NOTIFICATION_ICONS.get(severity, '💬'))
+            self.setStyleSheet(NOTIFICATION_STYLES.get(severity, NOTIFICATION_STYLES['info']))
     
     def show_notification(self, parent_widget):
         """Show notification with slide-in animation."""
@@ -249,6 +335,8 @@ class NotificationWidget(QWidget):
             end_pos = parent_rect.topLeft()
             end_pos.setY(end_pos.y() + 10)
             
+            self._closing = False
+            self.slide_animation.stop()
             self.move(start_pos)
             self.show()
             
@@ -256,19 +344,35 @@ class NotificationWidget(QWidget):
             self.slide_animation.setStartValue(start_pos)
             self.slide_animation.setEndValue(end_pos)
             self.slide_animation.start()
+            
+            if self.duration > 0:
+                self.close_timer.start(self.duration)
+            else:
+                self.close_timer.stop()
     
     def close_notification(self):
         """Close notification with slide-out animation."""
+        if self._closing or not self.isVisible():
+            return
+        self._closing = True
+        self.close_timer.stop()
+        
         # Animate slide-out
         current_pos = self.pos()
         end_pos = current_pos
         end_pos.setY(current_pos.y() - self.height() - 20)
         
+        self.slide_animation.stop()
         self.slide_animation.setStartValue(current_pos)
         self.slide_animation.setEndValue(end_pos)
-        self.slide_animation.finished.connect(self.hide)
-        self.slide_animation.finished.connect(self.closed.emit)
         self.slide_animation.start()
+    
+    def _on_slide_finished(self):
+        """Hide and announce closure once the slide-out completes."""
+        if self._closing:
+            self._closing = False
+            self.hide()
+            self.closed.emit()
 
 class EnhancedStatusBar(QWidget):
     """
@@ -278,8 +382,24 @@ class EnhancedStatusBar(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.error_manager = None
+        self._error_dialog = None  # ErrorDetailsDialog, created on first use
         self.status_indicators = {}
-        self.active_notifications = []
+        self.active_notifications = deque(maxlen=MAX_ACTIVE_NOTIFICATIONS)
+        self._notif_pool = []  # hidden NotificationWidgets ready for reuse
+        
+        # Error bursts refresh the summary once per window instead of once per error
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.setInterval(100)
+        self._summary_timer.timeout.connect(self._do_update_error_summary)
+        self._summary_shown = (0, 0, 0, 0)  # (total, critical, errors, warnings) on display
+        
+        # Component status reports are applied at most 10 times a second, latest per component
+        self._pending_status = {}  # component -> (status, message)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._flush_component_status)
         
         # Setup layout
         layout = QHBoxLayout(self)
@@ -298,15 +418,8 @@ class EnhancedStatusBar(QWidget):
         
         # Error summary
         self.error_summary_label = QLabel("No errors")
-        self.error_summary_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                font-size: 10px;
-                padding: 2px 6px;
-                border-radius: 3px;
-                background-color: #f0f0f0;
-            }
-        """)
+        self.error_summary_label.setStyleSheet(SUMMARY_STYLES['ok'])
+        self._summary_level = 'ok'
         layout.addWidget(self.error_summary_label)
         
         # Error details button
@@ -353,10 +466,18 @@ class EnhancedStatusBar(QWidget):
         self.update_error_summary()
     
     def update_component_status(self, component: str, status: str, message: str):
-        """Update status indicator for a component."""
+        """Queue a status update for a component; only the latest per component is applied."""
         if component in self.status_indicators:
+            self._pending_status[component] = (status, message)
+            if not self._status_timer.isActive():
+                self._status_timer.start()
+    
+    def _flush_component_status(self):
+        """Apply the queued component status updates."""
+        pending, self._pending_status = self._pending_status, {}
+        for component, (status, message) in pending.items():
             self.status_indicators[component].update_status(status, message)
-            logger.debug(f"Updated status indicator: {component} -> {status}")
+            logger.debug("Updated status indicator: %s -> %s", component, status)
     
     def on_error_reported(self, error_report: ErrorReport):
         """Handle new error report."""
@@ -374,31 +495,31 @@ class EnhancedStatusBar(QWidget):
         self.update_error_summary()
     
     def update_error_summary(self):
+        """Schedule an error summary refresh; calls within 100ms share one."""
+        if not self._summary_timer.isActive():
+            self._summary_timer.start()
+    
+    def _do_update_error_summary(self):
         """Update error summary display."""
         if not self.error_manager:
             return
         
         summary = self.error_manager.get_error_summary()
         total_errors = summary['total']
+        critical = summary['by_severity'].get('critical', 0)
+        errors = summary['by_severity'].get('error', 0)
+        warnings = summary['by_severity'].get('warning', 0)
+        
+        # Nothing to redraw if the counts on display are still right
+        shown = (total_errors, critical, errors, warnings)
+        if shown == self._summary_shown:
+            return
+        self._summary_shown = shown
         
         if total_errors == 0:
             self.error_summary_label.setText("No errors")
-            self.error_summary_label.setStyleSheet("""
-                QLabel {
-                    color: #666;
-                    font-size: 10px;
-                    padding: 2px 6px;
-                    border-radius: 3px;
-                    background-color: #f0f0f0;
-                }
-            """)
-            self.error_details_btn.setVisible(False)
+            level = 'ok'
         else:
-            # Count by severity
-            critical = summary['by_severity'].get('critical', 0)
-            errors = summary['by_severity'].get('error', 0)
-            warnings = summary['by_severity'].get('warning', 0)
-            
             # Create summary text
             parts = []
             if critical > 0:
@@ -413,56 +534,99 @@ class EnhancedStatusBar(QWidget):
             
             # Color based on highest severity
             if critical > 0:
-                color = "#f44336"  # Red
-                bg_color = "#FFEBEE"
+                level = 'critical'
             elif errors > 0:
-                color = "#FF5722"  # Deep Orange
-                bg_color = "#FFF3E0"
+                level = 'error'
             else:
-                color = "#FF9800"  # Orange
-                bg_color = "#FFF8E1"
-            
-            self.error_summary_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {color};
-                    font-size: 10px;
-                    font-weight: bold;
-                    padding: 2px 6px;
-                    border-radius: 3px;
-                    background-color: {bg_color};
-                    border: 1px solid {color};
-                }}
-            """)
-            
-            self.error_details_btn.setVisible(True)
+                level = 'warning'
+        
+        # Restyle only when the highest severity changes
+        if level != self._summary_level:
+            self._summary_level = level
+            self.error_summary_label.setStyleSheet(SUMMARY_STYLES[level])
+        self.error_details_btn.setVisible(total_errors > 0)
     
-    def show_notification(self, title: str, message: str, severity: str, duration: int):
-        """Show a non-blocking notification."""
-        notification = NotificationWidget(title, message, severity, duration)
-        notification.closed.connect(lambda: self._remove_notification(notification))
+    def show_notification(self, title: str, message: str, severity: str, duration: int,
+                          anchor: QWidget = None):
+        """Show a non-blocking notification, positioned over anchor (default: our parent)."""
+        if self._notif_pool:
+            notification = self._notif_pool.pop()
+        elif len(self.active_notifications) < MAX_ACTIVE_NOTIFICATIONS:
+            notification = NotificationWidget(title, message, severity, duration)
+            notification.closed.connect(self._on_notification_closed)
+        else:
+            # At the visible cap: re-skin the oldest one in place
+            notification = self.active_notifications.popleft()
         
-        # Position notification
-        notification.show_notification(self.parent())
+        notification.set_content(title, message, severity, duration)
+        notification.show_notification(anchor or self.parent())
         self.active_notifications.append(notification)
-        
-        # Limit number of active notifications
-        if len(self.active_notifications) > 3:
-            oldest = self.active_notifications.pop(0)
-            oldest.close_notification()
+    
+    def _on_notification_closed(self):
+        """Route a pooled widget's closed signal back to its own entry."""
+        self._remove_notification(self.sender())
     
     def _remove_notification(self, notification):
-        """Remove notification from active list."""
+        """Return a closed notification to the pool for reuse."""
         if notification in self.active_notifications:
             self.active_notifications.remove(notification)
-        notification.deleteLater()
+            self._notif_pool.append(notification)
     
     def show_error_details(self):
         """Show detailed error information dialog."""
         if not self.error_manager:
             return
         
-        dialog = ErrorDetailsDialog(self.error_manager, self)
-        dialog.exec()
+        # Built on first use and reused; it refreshes itself each time it is shown
+        if self._error_dialog is None or self._error_dialog.error_manager is not self.error_manager:
+            self._error_dialog = ErrorDetailsDialog(self.error_manager, self)
+        self._error_dialog.exec()
+
+@lru_cache(maxsize=256)
+def format_error_time(timestamp: int) -> str:
+    """Format a whole-second timestamp as HH:MM:SS; repaints of the same rows hit the cache."""
+    return time.strftime("%H:%M:%S", time.localtime(timestamp))
+
+class ErrorListModel(QAbstractListModel):
+    """
+    List model over a plain list of ErrorReports.
+    
+    Row text is built on demand for the rows the view actually paints, and
+    a refresh is a single model reset instead of one item per error.
+    """
+    
+    def __init__(self, history: bool = False, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.errors = []
+    
+    def set_errors(self, errors):
+        """Replace the displayed errors with one model reset."""
+        self.beginResetModel()
+        self.errors = errors
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.errors)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        error = self.errors[index.row()]
+        
+        if role == Qt.DisplayRole:
+            if self.history:
+                timestamp = format_error_time(int(error.timestamp))
+                return f"[{timestamp}] [{error.severity.value.upper()}] {error.title}"
+            item_text = f"[{error.severity.value.upper()}] {error.title}: {error.message}"
+            if error.component:
+                item_text += f" ({error.component})"
+            return item_text
+        if role == Qt.BackgroundRole and not self.history:
+            return ERROR_SEVERITY_BACKGROUNDS.get(error.severity)
+        if role == Qt.ToolTipRole and self.history:
+            return f"{error.message}\nDetails: {error.details or 'None'}"
+        return None
 
 class ErrorDetailsDialog(QDialog):
     """
@@ -484,7 +648,10 @@ class ErrorDetailsDialog(QDialog):
         active_group = QGroupBox("Active Errors")
         active_layout = QVBoxLayout(active_group)
         
-        self.active_errors_list = QListWidget()
+        self.active_model = ErrorListModel(parent=self)
+        self.active_errors_list = QListView()
+        self.active_errors_list.setUniformItemSizes(True)
+        self.active_errors_list.setModel(self.active_model)
         active_layout.addWidget(self.active_errors_list)
         
         # Clear button
@@ -498,7 +665,10 @@ class ErrorDetailsDialog(QDialog):
         history_group = QGroupBox("Recent Error History")
         history_layout = QVBoxLayout(history_group)
         
-        self.history_list = QListWidget()
+        self.history_model = ErrorListModel(history=True, parent=self)
+        self.history_list = QListView()
+        self.history_list.setUniformItemSizes(True)
+        self.history_list.setModel(self.history_model)
         history_layout.addWidget(self.history_list)
         
         layout.addWidget(history_group)
@@ -507,45 +677,18 @@ class ErrorDetailsDialog(QDialog):
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(self.accept)
         layout.addWidget(close_btn)
-        
-        # Populate data
+    
+    def showEvent(self, event):
+        """Fill the lists as the dialog appears, so opening it is not blocked on them."""
+        super().showEvent(event)
         self.refresh_data()
     
     def refresh_data(self):
         """Refresh error data in the dialog."""
-        # Clear lists
-        self.active_errors_list.clear()
-        self.history_list.clear()
+        self.active_model.set_errors(self.error_manager.get_active_errors())
         
-        # Active errors
-        active_errors = self.error_manager.get_active_errors()
-        for error in active_errors:
-            item_text = f"[{error.severity.value.upper()}] {error.title}: {error.message}"
-            if error.component:
-                item_text += f" ({error.component})"
-            
-            item = QListWidgetItem(item_text)
-            
-            # Color based on severity
-            if error.severity == ErrorSeverity.CRITICAL:
-                item.setBackground(QColor("#FFEBEE"))
-            elif error.severity == ErrorSeverity.ERROR:
-                item.setBackground(QColor("#FFF3E0"))
-            elif error.severity == ErrorSeverity.WARNING:
-                item.setBackground(QColor("#FFF8E1"))
-            
-            self.active_errors_list.addItem(item)
-        
-        # Error history (last 20)
-        history = self.error_manager.get_error_history(20)
-        for error in reversed(history):  # Most recent first
-            timestamp = time.strftime("%H:%M:%S", time.localtime(error.timestamp))
-            item_text = f"[{timestamp}] [{error.severity.value.upper()}] {error.title}"
-            
-            item = QListWidgetItem(item_text)
-            item.setToolTip(f"{error.message}\nDetails: {error.details or 'None'}")
-            
-            self.history_list.addItem(item)
+        # Error history (last 20), most recent first
+        self.history_model.set_errors(list(reversed(self.error_manager.get_error_history(20))))
     
     def clear_all_errors(self):
         """Clear all active errors."""
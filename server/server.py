@@ -11,10 +11,10 @@ import json
 import time
 from typing import Dict, Set, Optional
 from utils.logger import setup_logger
-from utils.config import config, DEFAULT_TCP_PORT, DEFAULT_UDP_PORT, BUFFER_SIZE
+from utils.config import config, DEFAULT_TCP_PORT, DEFAULT_UDP_PORT, BUFFER_SIZE, get_local_ip_address
 from utils.network_proto import (
     MessageType, serialize_message, deserialize_message,
-    create_message, UDPPacket
+    create_message, UDPPacket, StreamType, generate_stream_id
 )
 from utils.file_transfer import ServerFileManager
 
@@ -80,6 +80,7 @@ class LANServer:
         
         # Client management
         self.clients: Dict[str, ClientConnection] = {}  # username -> ClientConnection
+        self.stream_owners: Dict[int, str] = {}  # UDP stream ID -> username, guarded by clients_lock
         self.clients_lock = threading.Lock()
         
         # Server sockets
@@ -89,26 +90,13 @@ class LANServer:
         # Server state
         self.running = False
         self.threads: Set[threading.Thread] = set()
+        self.ready_event = threading.Event()  # set once start() has finished, successfully or not
         
         # File manager
         self.file_manager = ServerFileManager()
         
         logger.info(f"Server initialized: session_id={session_id}, host={host_username}")
     
-    def _get_local_ip_address(self):
-        """Get the local IP address for display purposes."""
-        try:
-            # Connect to a remote address to determine local IP
-            # This doesn't actually send data, just determines routing
-            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-                s.connect(("8.8.8.8", 80))
-                local_ip = s.getsockname()[0]
-                logger.info(f"Detected local IP address: {local_ip}")
-                return local_ip
-        except Exception as e:
-            logger.warning(f"Failed to detect local IP: {e}")
-            return "127.0.0.1"
-    
     def _get_bind_address(self):
         """Get the address to bind the server to (always 0.0.0.0 for maximum compatibility)."""
         return "0.0.0.0"
@@ -188,7 +176,7 @@ class LANServer:
             
             # Get addresses for binding and display
             bind_address = self._get_bind_address()  # Always 0.0.0.0 for compatibility
-            local_ip = self._get_local_ip_address()  # For display/logging purposes
+            local_ip = get_local_ip_address()  # For display/logging purposes
             
             # Create and bind TCP socket with better error handling
             self.tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -236,6 +224,9 @@ class LANServer:
             logger.error(f"Failed to start server: {e}")
             self.stop()
             raise
+        finally:
+            # Wake anyone waiting on startup; they check self.running for the outcome
+            self.ready_event.set()
     
     def stop(self):
         """Stop the server and close all connections."""
@@ -250,6 +241,7 @@ class LANServer:
                 except:
                     pass
             self.clients.clear()
+            self.stream_owners.clear()
         
         # Close server sockets
         if self.tcp_socket:
@@ -283,6 +275,8 @@ class LANServer:
             try:
                 self.tcp_socket.settimeout(1.0)
                 client_socket, address = self.tcp_socket.accept()
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
                 logger.info(f"New TCP connection from {address}")
                 
                 # Handle client in new thread
@@ -320,7 +314,7 @@ class LANServer:
                     logger.info(f"Client {address} disconnected")
                     break
                 
-                logger.debug(f"Received {len(data)} bytes from {address}")
+                logger.debug("Received %d bytes from %s", len(data), address)
                 
                 buffer += data
                 
@@ -340,7 +334,7 @@ class LANServer:
                     # Deserialize and handle
                     try:
                         message = json.loads(message_data.decode('utf-8'))
-                        logger.debug(f"Received message from {address}: {message}")
+                        logger.debug("Received message from %s: %s", address, message)
                         username = self._handle_control_message(
                             message, client_socket, address, username
                         )
@@ -367,7 +361,7 @@ class LANServer:
         Returns the username if this is an auth request, otherwise returns current_username.
         """
         msg_type = message.get('type')
-        logger.debug(f"Received message type: {msg_type}")
+        logger.debug("Received message type: %s", msg_type)
         
         # Authentication
         if msg_type == MessageType.AUTH_REQUEST.value:
@@ -405,6 +399,8 @@ class LANServer:
                 
                 client = ClientConnection(client_socket, address, username)
                 self.clients[username] = client
+                for stream_type in StreamType:
+                    self.stream_owners[generate_stream_id(username, stream_type)] = username
             
             # Send success response
             response = create_message(
@@ -563,7 +559,7 @@ class LANServer:
             
             # Relay screen frame to all other clients
             self._broadcast_message(message, exclude=from_user)
-            logger.debug(f"Relayed screen frame from {from_user}")
+            logger.debug("Relayed screen frame from %s", from_user)
         
         # Leave session
         elif msg_type == MessageType.LEAVE_SESSION.value:
@@ -616,6 +612,8 @@ class LANServer:
         with self.clients_lock:
             if username in self.clients:
                 del self.clients[username]
+                for stream_type in StreamType:
+                    self.stream_owners.pop(generate_stream_id(username, stream_type), None)
                 logger.info(f"Removed client '{username}'")
         
         # Notify others
@@ -649,7 +647,7 @@ class LANServer:
                         sender_username = self._learn_udp_address(packet.stream_id, address)
                         
                         if sender_username:
-                            logger.info(f"Received UDP packet from {sender_username}: seq={packet.seq_num}")
+                            logger.debug("Received UDP packet from %s: seq=%d", sender_username, packet.seq_num)
                             # Relay to all other clients
                             self._relay_udp_packet(data, address, sender_username)
                         else:
@@ -676,24 +674,20 @@ class LANServer:
         Returns:
             Username of the sender, or None if not found
         """
-        # Import here to avoid circular imports
-        from utils.network_proto import StreamType, generate_stream_id
-        
         with self.clients_lock:
-            # Try to match stream ID to existing clients
+            # Stream IDs are registered at authentication, so this is one dict lookup per packet
+            username = self.stream_owners.get(stream_id)
+            if username is not None:
+                client = self.clients[username]
+                # Update UDP address if not set or if it changed
+                if client.udp_address != address:
+                    client.udp_address = address
+                    logger.info(f"Learned UDP address for '{username}': {address}")
+                return username
+            
+            # Unknown stream ID: fall back to the address we already know for a client
             for username, client in self.clients.items():
-                # Generate expected stream IDs for this user
-                expected_audio_id = generate_stream_id(username, StreamType.AUDIO)
-                expected_video_id = generate_stream_id(username, StreamType.VIDEO)
-                
-                # Check if this stream ID matches this user
-                if stream_id == expected_audio_id or stream_id == expected_video_id:
-                    # Update UDP address if not set or if it changed
-                    if client.udp_address != address:
-                        client.udp_address = address
-                        logger.info(f"Learned UDP address for '{username}': {address}")
-                    return username
-                elif client.udp_address == address:
+                if client.udp_address == address:
                     # Address matches but stream ID doesn't - this shouldn't happen
                     logger.warning(f"UDP address {address} matches {username} but stream ID {stream_id} doesn't match expected IDs")
                     return username
@@ -745,12 +739,12 @@ class LANServer:
                     try:
                         self.udp_socket.sendto(packet_data, client.udp_address)
                         relayed_count += 1
-                        logger.debug(f"Relayed UDP packet to '{username}' at {client.udp_address}")
+                        logger.debug("Relayed UDP packet to '%s' at %s", username, client.udp_address)
                     except Exception as e:
                         logger.error(f"Failed to relay UDP to '{username}': {e}")
         
         if relayed_count > 0:
-            logger.info(f"Relayed packet from '{sender_username}' to {relayed_count} clients")
+            logger.debug("Relayed packet from '%s' to %d clients", sender_username, relayed_count)
     
     # ========================================================================
     # Heartbeat and Connection Monitoring
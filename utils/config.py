@@ -5,6 +5,7 @@ Handles application settings, network ports, and default values.
 
 import json
 import socket
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Tuple
 from utils.logger import setup_logger
@@ -34,6 +35,9 @@ VIDEO_FPS = 30
 AUDIO_SAMPLE_RATE = 44100
 AUDIO_CHANNELS = 2
 
+# Chat configuration
+MAX_CHAT_MESSAGES = 2000  # Older messages scroll off the chat history
+
 # Profiles configuration
 PROFILES_FILE = PROJECT_ROOT / "profiles.json"
 
@@ -47,6 +51,7 @@ class Config:
         """Initialize configuration manager."""
         self.config_file = config_file or (PROJECT_ROOT / "config.json")
         self.settings: Dict[str, Any] = self._load_defaults()
+        self._loaded_mtime_ns = None  # mtime of the file contents already in settings
         self.load()
     
     def _load_defaults(self) -> Dict[str, Any]:
@@ -72,23 +77,35 @@ class Config:
         }
     
     def load(self) -> None:
-        """Load configuration from file, or use defaults if file doesn't exist."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    loaded_settings = json.load(f)
-                    self.settings.update(loaded_settings)
-                logger.info(f"Configuration loaded from {self.config_file}")
-            except Exception as e:
-                logger.error(f"Failed to load configuration: {e}")
-        else:
+        """
+        Load configuration from file, or use defaults if file doesn't exist.
+        
+        The file is only re-read when its modification time has changed since
+        the last load or save.
+        """
+        try:
+            mtime_ns = self.config_file.stat().st_mtime_ns
+        except FileNotFoundError:
             logger.info("Using default configuration")
+            return
+        
+        if mtime_ns == self._loaded_mtime_ns:
+            return
+        
+        try:
+            loaded_settings = json.loads(self.config_file.read_bytes())
+            self.settings.update(loaded_settings)
+            self._loaded_mtime_ns = mtime_ns
+            logger.info(f"Configuration loaded from {self.config_file}")
+        except Exception as e:
+            logger.error(f"Failed to load configuration: {e}")
     
     def save(self) -> None:
         """Save current configuration to file."""
         try:
             with open(self.config_file, 'w') as f:
                 json.dump(self.settings, f, indent=2)
+            self._loaded_mtime_ns = self.config_file.stat().st_mtime_ns
             logger.info(f"Configuration saved to {self.config_file}")
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
@@ -152,5 +169,28 @@ def find_available_ports(start_port: int = 49152, count: int = 2) -> Tuple[int,
     logger.warning("No available ports found in dynamic range, using defaults")
     return DEFAULT_TCP_PORT, DEFAULT_UDP_PORT
 
+@lru_cache(maxsize=1)
+def get_local_ip_address() -> str:
+    """
+    Get the local LAN IP address of this machine.
+    
+    The routing probe runs once per process; call
+    get_local_ip_address.cache_clear() to re-detect after a network change.
+    
+    Returns:
+        Local IP address, or "127.0.0.1" if it cannot be determined
+    """
+    try:
+        # Connect to a remote address to determine local IP
+        # This doesn't actually send data, just determines routing
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            local_ip = s.getsockname()[0]
+            logger.info(f"Detected local IP address: {local_ip}")
+            return local_ip
+    except Exception as e:
+        logger.warning(f"Failed to detect local IP: {e}, falling back to localhost")
+        return "127.0.0.1"
+
 # Global configuration instance
 config = Config()
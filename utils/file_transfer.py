@@ -5,6 +5,7 @@ Handles chunked file upload/download with integrity verification and progress tr
 """
 
 import os
+import stat
 import hashlib
 import uuid
 import threading
@@ -84,11 +85,14 @@ class FileTransferManager:
         """
         try:
             file_path = Path(file_path)
-            if not file_path.exists():
+            # A single stat covers the existence, file-type and size checks
+            try:
+                file_stat = file_path.stat()
+            except FileNotFoundError:
                 logger.error(f"File not found: {file_path}")
                 return None
             
-            if not file_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 logger.error(f"Path is not a file: {file_path}")
                 return None
             
@@ -96,19 +100,15 @@ class FileTransferManager:
             file_id = str(uuid.uuid4())
             
             # Get file info
-            file_size = file_path.stat().st_size
+            file_size = file_stat.st_size
             filename = file_path.name
             
-            # Calculate checksum
-            logger.info(f"Calculating checksum for {filename}...")
-            checksum = self._calculate_file_checksum(file_path)
-            
-            # Create transfer info
+            # Create transfer info (checksum is filled in by the upload thread,
+            # so the caller - usually the GUI thread - never reads the whole file)
             transfer_info = FileTransferInfo(
                 file_id=file_id,
                 filename=filename,
                 file_size=file_size,
-                checksum=checksum,
                 uploader=self.client.username if self.client else "unknown"
             )
             
@@ -133,6 +133,11 @@ class FileTransferManager:
     def _upload_file_chunks(self, file_path: Path, transfer_info: FileTransferInfo, mode: str, targets: list):
         """Upload file in chunks with retry logic and network error recovery."""
         try:
+            # Calculate checksum here rather than in upload_file (sent with every chunk)
+            if not transfer_info.checksum:
+                logger.info(f"Calculating checksum for {transfer_info.filename}...")
+                transfer_info.checksum = self._calculate_file_checksum(file_path)
+            
             # Initialize retry tracking for this file
             with self.transfers_lock:
                 self.chunk_retry_counts[transfer_info.file_id] = {}
@@ -152,18 +157,24 @@ class FileTransferManager:
             with open(file_path, 'rb') as f:
                 chunk_index = 0
                 
+                # One reusable chunk buffer instead of a new bytes object per chunk
+                chunk_buffer = bytearray(transfer_info.chunk_size)
+                chunk_view = memoryview(chunk_buffer)
+                
                 while chunk_index < transfer_info.total_chunks:
                     # Check if we should skip already uploaded chunks (for resume)
                     if chunk_index in transfer_info.uploaded_chunks:
-                        f.seek((chunk_index + 1) * transfer_info.chunk_size)
                         chunk_index += 1
                         continue
                     
-                    # Read chunk
-                    f.seek(chunk_index * transfer_info.chunk_size)
-                    chunk_data = f.read(transfer_info.chunk_size)
-                    if not chunk_data:
+                    # Read chunk (only seek when resuming/retrying, reads are otherwise sequential)
+                    offset = chunk_index * transfer_info.chunk_size
+                    if f.tell() != offset:
+                        f.seek(offset)
+                    bytes_read = f.readinto(chunk_buffer)
+                    if not bytes_read:
                         break
+                    chunk_data = chunk_view[:bytes_read]
                     
                     # Attempt to send chunk with retry logic
                     success = self._send_chunk_with_retry(transfer_info, chunk_index, chunk_data)
@@ -386,9 +397,14 @@ class FileTransferManager:
         sha256_hash = hashlib.sha256()
         
         with open(file_path, 'rb') as f:
-            # Read file in chunks to handle large files
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
+            # Read file in large blocks into one buffer to keep syscalls and copies down
+            buffer = bytearray(1024 * 1024)
+            view = memoryview(buffer)
+            while True:
+                bytes_read = f.readinto(buffer)
+                if not bytes_read:
+                    break
+                sha256_hash.update(view[:bytes_read])
         
         return sha256_hash.hexdigest()
     